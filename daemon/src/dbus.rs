@@ -9,15 +9,19 @@
 //! - `ShowMenu(x: i32, y: i32)` - Display radial menu at coordinates
 //! - `HideMenu()` - Dismiss the radial menu
 //! - `ExecuteAction(action_id: String)` - Execute an action by ID
+//! - `MenuClosed()` - Overlay reports the menu was dismissed
 //!
 //! ### Signals:
 //! - `MenuRequested(x: i32, y: i32)` - Emitted when menu should appear
 //! - `SliceSelected(index: u8)` - Emitted when a slice is highlighted
 //! - `ActionExecuted(action_id: String)` - Emitted after action runs
 
+use std::sync::atomic::Ordering;
+
 use zbus::{interface, object_server::SignalEmitter, fdo};
 use crate::battery::SharedBatteryState;
 use crate::config::{Config, SharedConfig};
+use crate::evdev::SharedMenuClosed;
 use crate::hidpp::{SharedHapticManager, HapticEvent};
 
 /// D-Bus interface name
@@ -43,14 +47,18 @@ pub struct JuhRadialService {
     config: SharedConfig,
     /// Shared haptic manager for triggering haptic feedback
     haptic_manager: SharedHapticManager,
+    /// Raised when the overlay reports the menu closed (stops cursor tracking)
+    menu_closed: SharedMenuClosed,
 }
 
 impl JuhRadialService {
-    /// Create a new D-Bus service instance with battery state, config, and haptic manager
+    /// Create a new D-Bus service instance with battery state, config, haptic
+    /// manager and the evdev handler's menu-closed flag
     pub fn new(
         battery_state: SharedBatteryState,
         config: SharedConfig,
         haptic_manager: SharedHapticManager,
+        menu_closed: SharedMenuClosed,
     ) -> Self {
         Self {
             current_profile: "default".to_string(),
@@ -58,6 +66,7 @@ impl JuhRadialService {
             battery_state,
             config,
             haptic_manager,
+            menu_closed,
         }
     }
 }
@@ -100,6 +109,17 @@ impl JuhRadialService {
         Ok(())
     }
 
+    /// Report that the overlay dismissed the menu
+    ///
+    /// Called by the overlay whenever the menu closes. A toggle-mode menu can
+    /// be closed without the gesture button (Escape, click), so this is what
+    /// stops the CursorMoved stream for it.
+    async fn menu_closed(&self) -> fdo::Result<()> {
+        tracing::debug!("MenuClosed called");
+        self.menu_closed.store(true, Ordering::Relaxed);
+        Ok(())
+    }
+
     /// Execute an action by its identifier
     ///
     /// Called when user selects a slice and releases gesture button.
@@ -644,6 +664,7 @@ impl JuhRadialService {
 /// * `battery_state` - Shared battery state for GetBatteryStatus method
 /// * `config` - Shared configuration for hot-reload support
 /// * `haptic_manager` - Shared haptic manager for triggering haptic feedback
+/// * `menu_closed` - Flag shared with the evdev handler, raised by `MenuClosed`
 ///
 /// # Returns
 /// A `zbus::Connection` that should be kept alive for the service to run.
@@ -651,8 +672,9 @@ pub async fn init_dbus_service(
     battery_state: SharedBatteryState,
     config: SharedConfig,
     haptic_manager: SharedHapticManager,
+    menu_closed: SharedMenuClosed,
 ) -> zbus::Result<zbus::Connection> {
-    let service = JuhRadialService::new(battery_state, config, haptic_manager);
+    let service = JuhRadialService::new(battery_state, config, haptic_manager, menu_closed);
 
     let connection = zbus::connection::Builder::session()?
         .name(DBUS_NAME)?
@@ -674,6 +696,7 @@ mod tests {
     use super::*;
     use crate::battery::new_shared_state;
     use crate::config::new_shared_config;
+    use crate::evdev::new_menu_closed_flag;
     use crate::hidpp::new_shared_haptic_manager;
 
     #[test]
@@ -689,7 +712,12 @@ mod tests {
         let config = new_shared_config();
         let haptic_config = config.read().unwrap().haptics.clone();
         let haptic_manager = new_shared_haptic_manager(&haptic_config);
-        let service = JuhRadialService::new(battery_state, config, haptic_manager);
+        let service = JuhRadialService::new(
+            battery_state,
+            config,
+            haptic_manager,
+            new_menu_closed_flag(),
+        );
         assert_eq!(service.current_profile, "default");
         // Check haptics from config
         let haptics = service.config.read().unwrap().haptics.enabled;
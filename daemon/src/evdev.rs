@@ -12,6 +12,8 @@
 //! `GestureEvent::Pressed` and `GestureEvent::Released` accordingly.
 
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
 use std::time::Instant;
 use tokio::sync::mpsc;
 
@@ -36,6 +38,21 @@ pub const GESTURE_BUTTON_CODES: &[u16] = &[
 /// Press event (value=1) triggers menu, release event (value=0) dismisses
 pub const LOGID_GESTURE_KEY: u16 = 189;   // KEY_F19
 
+/// Releases shorter than this leave the overlay open in toggle mode.
+/// Must match `RadialMenu.TAP_THRESHOLD_MS` in overlay/juhradial-overlay.py;
+/// if the two disagree the overlay's `MenuClosed` call still ends tracking.
+pub const TOGGLE_TAP_MS: u64 = 250;
+
+/// Raised by the D-Bus `MenuClosed` method when the overlay dismisses the
+/// menu on its own (Escape, click, selection); the evdev handler then stops
+/// streaming CursorMoved for a toggle-mode menu
+pub type SharedMenuClosed = Arc<AtomicBool>;
+
+/// Create a new, lowered menu-closed flag
+pub fn new_menu_closed_flag() -> SharedMenuClosed {
+    Arc::new(AtomicBool::new(false))
+}
+
 /// Event types for gesture button
 #[derive(Debug, Clone, Copy, PartialEq)]
 pub enum GestureEvent {
@@ -76,13 +93,19 @@ pub struct EvdevHandler {
     cursor_x: i32,
     /// Current cursor Y position (tracked while button held)
     cursor_y: i32,
-    /// Whether menu is currently active (button held)
+    /// Whether menu is currently active (button held, or open in toggle mode)
     menu_active: bool,
+    /// Menu was opened with a quick tap and stays open (cursor still tracked)
+    toggle_tracking: bool,
+    /// Current press is the second tap that closes a toggle-mode menu
+    closing_tap: bool,
+    /// Set when the overlay reports the menu closed
+    menu_closed: SharedMenuClosed,
 }
 
 impl EvdevHandler {
     /// Create a new evdev handler
-    pub fn new(event_tx: mpsc::Sender<GestureEvent>) -> Self {
+    pub fn new(event_tx: mpsc::Sender<GestureEvent>, menu_closed: SharedMenuClosed) -> Self {
         Self {
             event_tx,
             device_path: None,
@@ -91,6 +114,9 @@ impl EvdevHandler {
             cursor_x: 0,
             cursor_y: 0,
             menu_active: false,
+            toggle_tracking: false,
+            closing_tap: false,
+            menu_closed,
         }
     }
 
@@ -298,9 +324,21 @@ impl EvdevHandler {
                             let key_code = event.code();
                             if GESTURE_BUTTON_CODES.contains(&key_code) {
                                 self.handle_gesture_event(event.value()).await;
+                            } else if self.toggle_tracking && event.value() == 1 {
+                                // Any other button press selects or dismisses
+                                // the toggle-mode menu - stop tracking
+                                self.toggle_tracking = false;
+                                self.menu_active = false;
                             }
                         }
                         EventType::RELATIVE => {
+                            // The overlay closed the toggle-mode menu itself
+                            if self.toggle_tracking
+                                && self.menu_closed.swap(false, Ordering::Relaxed)
+                            {
+                                self.toggle_tracking = false;
+                                self.menu_active = false;
+                            }
                             // Track mouse movement while menu is active
                             if self.menu_active {
                                 let code = RelativeAxisCode(event.code());
@@ -346,7 +384,12 @@ impl EvdevHandler {
             1 => {
                 // Button pressed - get cursor position
                 self.press_time = Some(Instant::now());
+                // A press while the toggle-mode menu is open is the second tap
+                self.closing_tap = self.toggle_tracking;
+                self.toggle_tracking = false;
                 self.menu_active = true;
+                // Close reports from the previous menu no longer apply
+                self.menu_closed.store(false, Ordering::Relaxed);
                 // Initialize relative cursor tracking (0,0 = menu center)
                 self.cursor_x = 0;
                 self.cursor_y = 0;
@@ -371,7 +414,6 @@ impl EvdevHandler {
             }
             0 => {
                 // Button released
-                self.menu_active = false;
                 let duration_ms = self
                     .press_time
                     .map(|t| t.elapsed().as_millis() as u64)
@@ -379,6 +421,12 @@ impl EvdevHandler {
 
                 self.press_time = None;
 
+                // Quick tap leaves the menu open in toggle mode - keep streaming
+                // CursorMoved so the overlay follows motion without polling
+                self.toggle_tracking = duration_ms < TOGGLE_TAP_MS && !self.closing_tap;
+                self.closing_tap = false;
+                self.menu_active = self.toggle_tracking;
+
                 tracing::info!(duration_ms, "Gesture button released");
 
                 let _ = self.event_tx.send(GestureEvent::Released { duration_ms }).await;
@@ -14,7 +14,10 @@ use juhradiald::{
     config::load_shared_config,
     cursor::{get_screen_bounds, ScreenBounds},
     dbus::{init_dbus_service, DBUS_PATH, DBUS_NAME},
-    evdev::{EvdevHandler, EvdevError, GestureEvent, LogidHandler},
+    evdev::{
+        new_menu_closed_flag, EvdevHandler, EvdevError, GestureEvent, LogidHandler,
+        SharedMenuClosed,
+    },
     hidraw::{HidrawHandler, HidrawError},
     new_shared_haptic_manager,
     profiles::ProfileManager,
@@ -95,11 +98,15 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     // Clone haptic_manager for battery updater before passing to D-Bus
     let haptic_manager_for_battery = haptic_manager.clone();
 
+    // Raised over D-Bus when the overlay closes the menu, read by the evdev handler
+    let menu_closed = new_menu_closed_flag();
+
     // Initialize D-Bus service with battery state, config, and haptic manager
     let dbus_connection = match init_dbus_service(
         battery_state.clone(),
         shared_config.clone(),
         haptic_manager,
+        menu_closed.clone(),
     ).await {
         Ok(conn) => {
             info!("D-Bus service initialized successfully");
@@ -180,7 +187,7 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     let evdev_handle = if !logid_available {
         let evdev_tx = event_tx.clone();
         Some(tokio::spawn(async move {
-            run_evdev_loop(evdev_tx).await
+            run_evdev_loop(evdev_tx, menu_closed).await
         }))
     } else {
         None
@@ -348,8 +355,8 @@ async fn run_hidraw_loop(event_tx: mpsc::Sender<GestureEvent>) {
 /// - Initial device detection
 /// - Polling for device when not found (2-second intervals)
 /// - Reconnection after device disconnect
-async fn run_evdev_loop(event_tx: mpsc::Sender<GestureEvent>) {
-    let mut handler = EvdevHandler::new(event_tx.clone());
+async fn run_evdev_loop(event_tx: mpsc::Sender<GestureEvent>, menu_closed: SharedMenuClosed) {
+    let mut handler = EvdevHandler::new(event_tx.clone(), menu_closed);
 
     loop {
         // Try to find and connect to the device
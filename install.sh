@@ -483,6 +483,9 @@ install_files() {
     # Install overlay scripts
     sudo mkdir -p /usr/share/juhradial
     sudo cp -r overlay/*.py /usr/share/juhradial/
+    # Precompile bytecode - users can't write __pycache__ under /usr/share,
+    # so without this every launch recompiles themes.py and the settings modules
+    sudo python3 -m compileall -q /usr/share/juhradial/ >/dev/null || true
     log_success "Overlay scripts"
 
     # Install locale files
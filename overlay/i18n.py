@@ -13,15 +13,16 @@ SPDX-License-Identifier: GPL-3.0
 
 import gettext
 import locale
-import json
+import sys
 from pathlib import Path
 
+from themes import load_config
+
 # Locale directory: development = overlay/locales/, installed = /usr/share/juhradial/locales/
 _DEV_LOCALE_DIR = Path(__file__).parent / "locales"
 _INSTALLED_LOCALE_DIR = Path("/usr/share/juhradial/locales")
 LOCALE_DIR = _DEV_LOCALE_DIR if _DEV_LOCALE_DIR.exists() else _INSTALLED_LOCALE_DIR
 
-CONFIG_FILE = Path.home() / ".config" / "juhradial" / "config.json"
 DOMAIN = "juhradial"
 
 SUPPORTED_LANGUAGES = {
@@ -45,12 +46,9 @@ SUPPORTED_LANGUAGES = {
 def get_configured_language() -> str:
     """Read language from config.json, fallback to 'system'."""
     try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                config = json.load(f)
-            return config.get("language", "system")
-    except (json.JSONDecodeError, OSError):
-        pass  # Config file doesn't exist or is corrupted, use system default
+        return load_config().get("language", "system")
+    except (ValueError, OSError):
+        pass  # Config file is corrupted or unreadable, use system default
     return "system"
 
 
@@ -89,8 +87,6 @@ def reload_language():
     """Reload translations and patch _ in all imported settings modules."""
     global _
     _ = setup_i18n()
-    import sys
-
     for name, mod in sys.modules.items():
         if (
             mod
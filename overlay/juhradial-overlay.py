@@ -16,18 +16,28 @@ import sys
 # (Native Wayland doesn't allow apps to position their own windows)
 os.environ["QT_QPA_PLATFORM"] = "xcb"
 
-import math
+import json
+import logging
 import shlex
+import socket
 import subprocess
+from functools import lru_cache
+from math import ceil, cos, pi, radians, sin
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Tuple
 from PyQt6.QtWidgets import QApplication, QWidget, QSystemTrayIcon, QMenu
 from PyQt6.QtCore import (
     Qt,
     pyqtSlot,
     QPropertyAnimation,
     QEasingCurve,
+    QElapsedTimer,
+    QPoint,
     QPointF,
+    QRect,
     QRectF,
     QTimer,
+    pyqtSignal,
 )
 from PyQt6.QtGui import QCursor
 from PyQt6.QtGui import (
@@ -40,30 +50,99 @@ from PyQt6.QtGui import (
     QPainterPath,
     QIcon,
     QPixmap,
+    QRegion,
 )
 from PyQt6.QtSvg import QSvgRenderer
-from PyQt6.QtDBus import QDBusConnection, QDBusInterface
+from PyQt6.QtDBus import (
+    QDBus,
+    QDBusAbstractInterface,
+    QDBusConnection,
+    QDBusMessage,
+)
+
+logger = logging.getLogger("juhradial-overlay")
 
 # =============================================================================
-# GEOMETRY
+# GEOMETRY - Uses shared radial_geometry.py module (Qt-free)
 # =============================================================================
-MENU_RADIUS = 150
-SHADOW_OFFSET = 12
-CENTER_ZONE_RADIUS = 45
-ICON_ZONE_RADIUS = 100
-SUBMENU_EXTEND = 80  # Extra space for submenu items beyond main menu
-WINDOW_SIZE = (MENU_RADIUS + SHADOW_OFFSET + SUBMENU_EXTEND) * 2
+from radial_geometry import (
+    MENU_RADIUS,
+    CENTER_ZONE_RADIUS,
+    ICON_ZONE_RADIUS,
+    WINDOW_SIZE,
+    SUBITEM_RADIUS,
+    MENU_RADIUS_SQ,
+    SUBMENU_REACH_SQ,
+    SUBITEM_HIT_SQ,
+    SUBITEM_RING_MIN_SQ,
+    SUBITEM_RING_MAX_SQ,
+    icon_position,
+    slice_index,
+    submenu_offsets,
+)
+
+
+# =============================================================================
+# SLICE GEOMETRY - identical every frame, so built once and shared
+# =============================================================================
+@lru_cache(maxsize=64)
+def slice_path(cx, cy, index, inner_r, outer_r):
+    """Ring-sector path for a slice (cached - never modify the result)"""
+    start_angle = index * 45 - 22.5 - 90
+    end_angle = start_angle + 45
+    start_cos = cos(radians(start_angle))
+    start_sin = sin(radians(start_angle))
+
+    path = QPainterPath()
+    # Start at inner arc, line out to the outer arc
+    path.moveTo(cx + inner_r * start_cos, cy + inner_r * start_sin)
+    path.lineTo(cx + outer_r * start_cos, cy + outer_r * start_sin)
+
+    # Outer arc
+    outer_rect = QRectF(cx - outer_r, cy - outer_r, outer_r * 2, outer_r * 2)
+    path.arcTo(outer_rect, -start_angle, -45)
+
+    # Line to inner arc end, then inner arc back
+    path.lineTo(
+        cx + inner_r * cos(radians(end_angle)),
+        cy + inner_r * sin(radians(end_angle)),
+    )
+    inner_rect = QRectF(cx - inner_r, cy - inner_r, inner_r * 2, inner_r * 2)
+    path.arcTo(inner_rect, -end_angle, 45)
+
+    path.closeSubpath()
+    return path
+
+
+@lru_cache(maxsize=8)
+def all_slices_path(cx, cy, inner_r, outer_r):
+    """Compound path of all eight slices (cached - never modify the result)"""
+    path = QPainterPath()
+    for index in range(8):
+        path.addPath(slice_path(cx, cy, index, inner_r, outer_r))
+    return path
+
+
+# Unit hexagon vertices, first one pointing up (badge shape)
+_HEXAGON_UNIT = tuple(
+    (cos(radians(i * 60 - 90)), sin(radians(i * 60 - 90))) for i in range(6)
+)
+
+
+
 
 # =============================================================================
 # THEME SYSTEM - Uses shared themes.py module
 # =============================================================================
 from themes import (
+    OVERLAY_BUS_NAME,
     get_colors,
+    load_config,
     load_theme_name,
     get_radial_image,
     get_radial_params,
 )
-from i18n import _
+from i18n import _, setup_i18n
 import settings_constants
 
 # =============================================================================
@@ -90,11 +169,9 @@ def _get_hyprland_socket():
 
 def _hyprland_ipc(command: bytes) -> str:
     """Send a command to Hyprland IPC and return the response string."""
-    import socket as _socket
-
     sock = None
     try:
-        sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.settimeout(0.1)
         sock.connect(_get_hyprland_socket())
         sock.send(command)
@@ -105,7 +182,7 @@ def _hyprland_ipc(command: bytes) -> str:
                 if not chunk:
                     break
                 chunks.append(chunk)
-            except _socket.timeout:
+            except socket.timeout:
                 break
         return b"".join(chunks).decode("utf-8").strip()
     finally:
@@ -120,13 +197,12 @@ def _hyprland_ipc(command: bytes) -> str:
 def _refresh_monitors():
     """Refresh cached monitor info from Hyprland."""
     global _monitors_cache
-    import json
 
     try:
         response = _hyprland_ipc(b"j/monitors")
         _monitors_cache = json.loads(response)
     except Exception as e:
-        print(f"[HYPRLAND] Failed to refresh monitors: {e}")
+        logger.warning("[HYPRLAND] Failed to refresh monitors: %s", e)
         if _monitors_cache is None:
             _monitors_cache = []
 
@@ -215,18 +291,72 @@ def get_cursor_pos():
     return (qpos.x(), qpos.y())
 
 
+@lru_cache(maxsize=256)
 def hex_to_qcolor(hex_color: str) -> QColor:
-    """Convert hex color string to QColor"""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return QColor(r, g, b)
+    """Convert hex color string to QColor.
+
+    Memoized - roles and themes with the same hex share one instance, so
+    callers must copy (QColor(c)) before calling setters on the result.
+    """
+    # Qt parses "#rrggbb" natively - no Python slicing/int() per channel
+    return QColor("#" + hex_color.lstrip("#")[:6])
+
+
+@lru_cache(maxsize=256)
+def rgba_color(r, g, b, a=255) -> QColor:
+    """Shared QColor for an (r, g, b[, a]) theme param - never modify it"""
+    return QColor(r, g, b, a)
+
+
+def _argb(color, alpha):
+    """Pack a QColor or (r, g, b[, a]) tuple into 0xAARRGGBB"""
+    if isinstance(color, QColor):
+        rgb = color.rgb() & 0xFFFFFF
+        if alpha is None:
+            alpha = color.alpha()
+    else:
+        rgb = (color[0] << 16) | (color[1] << 8) | color[2]
+        if alpha is None:
+            alpha = color[3] if len(color) > 3 else 255
+    return (alpha << 24) | rgb
+
+
+@lru_cache(maxsize=256)
+def _argb_brush(argb):
+    return QBrush(QColor.fromRgba(argb))
+
+
+@lru_cache(maxsize=256)
+def _argb_pen(argb, width):
+    return QPen(QColor.fromRgba(argb), width)
+
 
+def cached_brush(color, alpha=None) -> QBrush:
+    """Shared solid brush for a color, optionally with its alpha replaced.
+
+    Paint paths reuse these instead of copying a QColor, calling setAlpha
+    and wrapping it in a new QBrush every frame. Never modify the result.
+    """
+    return _argb_brush(_argb(color, alpha))
+
+
+def cached_pen(color, width=1.0, alpha=None) -> QPen:
+    """Shared pen for a color and width - same rules as cached_brush()"""
+    return _argb_pen(_argb(color, alpha), width)
+
+
+# QColor palettes already materialized this session, keyed by theme name
+_PALETTE_CACHE = {}
+
+
+def load_theme(theme_name: Optional[str] = None) -> MappingProxyType:
+    """Load theme from config and convert to QColor objects (read-only view)"""
+    if theme_name is None:
+        theme_name = load_theme_name()
+    cached = _PALETTE_CACHE.get(theme_name)
+    if cached is not None:
+        return cached
 
-def load_theme() -> dict:
-    """Load theme from config and convert to QColor objects"""
-    theme_name = load_theme_name()
     hex_colors = get_colors(theme_name)
 
     # Convert hex colors to QColor objects
@@ -242,12 +372,49 @@ def load_theme() -> dict:
     if "lavender" not in qcolors and "accent" in qcolors:
         qcolors["lavender"] = qcolors["accent"]
 
-    print(f"Loaded theme: {theme_name}")
-    return qcolors
+    logger.debug("Loaded theme: %s", theme_name)
+    palette = MappingProxyType(qcolors)
+    _PALETTE_CACHE[theme_name] = palette
+    return palette
 
 
-# Load theme at startup
-COLORS = load_theme()
+class _LazyColors(dict):
+    """Palette dict that defers load_theme() until a color is first needed.
+
+    Subclasses dict so that, once loaded, COLORS[role] in the paint path is
+    a plain C-level dict hit - __missing__ only runs on the first lookup.
+    """
+
+    _loaded = False
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.reload()
+
+    def __missing__(self, key):
+        if self._loaded:
+            raise KeyError(key)
+        self.reload()
+        return self[key]
+
+    def __contains__(self, key):
+        self._ensure_loaded()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        self._ensure_loaded()
+        return dict.get(self, key, default)
+
+    def reload(self, theme_name=None):
+        """Re-read the configured theme (cheap when it hasn't changed)"""
+        palette = load_theme(theme_name)
+        self.clear()
+        self.update(palette)
+        self._loaded = True
+
+
+# Theme is loaded on first color access, not at import
+COLORS = _LazyColors()
 
 # =============================================================================
 # 3D RADIAL IMAGE (loaded if theme has radial_image set)
@@ -288,12 +455,15 @@ def load_radial_image():
                     Qt.AspectRatioMode.KeepAspectRatio,
                     Qt.TransformationMode.SmoothTransformation,
                 )
-                print(
-                    f"Loaded 3D radial image: {path} ({RADIAL_IMAGE.width()}x{RADIAL_IMAGE.height()})"
+                logger.info(
+                    "Loaded 3D radial image: %s (%sx%s)",
+                    path,
+                    RADIAL_IMAGE.width(),
+                    RADIAL_IMAGE.height(),
                 )
                 return
 
-    print(f"Warning: 3D radial image '{image_name}' not found")
+    logger.warning("3D radial image '%s' not found", image_name)
     RADIAL_IMAGE = None
 
 
@@ -302,34 +472,52 @@ def load_radial_image():
 
 # =============================================================================
 # ACTIONS - 8 slices clockwise from top
-# Format: (label, type, command, color, icon, [submenu])
-# Submenu format: [(label, type, command, icon), ...]
 # =============================================================================
-AI_SUBMENU = [
-    ("Claude", "url", "https://claude.ai", "claude"),
-    ("ChatGPT", "url", "https://chat.openai.com", "chatgpt"),
-    ("Gemini", "url", "https://gemini.google.com", "gemini"),
-    ("Perplexity", "url", "https://perplexity.ai", "perplexity"),
-]
+class SubAction(NamedTuple):
+    """Submenu item"""
+
+    label: str
+    kind: str
+    command: str
+    icon: str
+
+
+class Action(NamedTuple):
+    """Radial menu slice"""
+
+    label: str
+    kind: str
+    command: str
+    color: str
+    icon: str
+    submenu: Optional[Tuple[SubAction, ...]] = None
+
+
+AI_SUBMENU = (
+    SubAction("Claude", "url", "https://claude.ai", "claude"),
+    SubAction("ChatGPT", "url", "https://chat.openai.com", "chatgpt"),
+    SubAction("Gemini", "url", "https://gemini.google.com", "gemini"),
+    SubAction("Perplexity", "url", "https://perplexity.ai", "perplexity"),
+)
 
 # Easy-Switch submenu - switch between paired hosts
-EASY_SWITCH_SUBMENU = [
-    ("Host 1", "easy_switch", "0", "host1"),
-    ("Host 2", "easy_switch", "1", "host2"),
-    ("Host 3", "easy_switch", "2", "host3"),
-]
+EASY_SWITCH_SUBMENU = (
+    SubAction("Host 1", "easy_switch", "0", "host1"),
+    SubAction("Host 2", "easy_switch", "1", "host2"),
+    SubAction("Host 3", "easy_switch", "2", "host3"),
+)
 
 # Default actions (fallback if config not found)
-DEFAULT_ACTIONS = [
-    ("Play/Pause", "exec", "playerctl play-pause", "green", "play_pause", None),
-    ("New Note", "exec", "kwrite", "yellow", "note", None),
-    ("Lock", "exec", "loginctl lock-session", "red", "lock", None),
-    ("Settings", "settings", "", "mauve", "settings", None),
-    ("Screenshot", "exec", "spectacle", "blue", "screenshot", None),
-    ("Emoji", "emoji", "", "pink", "emoji", None),
-    ("Files", "exec", "dolphin", "sapphire", "folder", None),
-    ("AI", "submenu", "", "teal", "ai", AI_SUBMENU),
-]
+DEFAULT_ACTIONS = (
+    Action("Play/Pause", "exec", "playerctl play-pause", "green", "play_pause"),
+    Action("New Note", "exec", "kwrite", "yellow", "note"),
+    Action("Lock", "exec", "loginctl lock-session", "red", "lock"),
+    Action("Settings", "settings", "", "mauve", "settings"),
+    Action("Screenshot", "exec", "spectacle", "blue", "screenshot"),
+    Action("Emoji", "emoji", "", "pink", "emoji"),
+    Action("Files", "exec", "dolphin", "sapphire", "folder"),
+    Action("AI", "submenu", "", "teal", "ai", AI_SUBMENU),
+)
 
 # Icon name mapping from GTK symbolic names to internal icon IDs
 ICON_NAME_MAP = {
@@ -354,23 +542,16 @@ ICON_NAME_MAP = {
 
 def load_actions_from_config():
     """Load radial menu actions from config file"""
-    import json
-    from pathlib import Path
-
-    config_path = Path.home() / ".config" / "juhradial" / "config.json"
-
     try:
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-
+        config = load_config()
+        if config:
             slices = config.get("radial_menu", {}).get("slices", [])
             easy_switch_enabled = config.get("radial_menu", {}).get(
                 "easy_switch_shortcuts", False
             )
 
             if not slices:
-                print("No radial_menu slices in config, using defaults")
+                logger.info("No radial_menu slices in config, using defaults")
                 return DEFAULT_ACTIONS
 
             settings_constants._ = _
@@ -381,9 +562,11 @@ def load_actions_from_config():
                 action_id = slice_data.get("action_id")
                 label = slice_data.get("label", "Action")
                 label = settings_constants.translate_radial_label(label, action_id)
-                action_type = slice_data.get("type", "exec")
+                # Intern JSON strings so kind checks in the hover/paint path
+                # compare by identity like the built-in default table does
+                action_type = sys.intern(slice_data.get("type", "exec"))
                 command = slice_data.get("command", "")
-                color = slice_data.get("color", "teal")
+                color = sys.intern(slice_data.get("color", "teal"))
                 gtk_icon = slice_data.get("icon", "application-x-executable-symbolic")
 
                 # Map GTK icon name to internal icon ID
@@ -399,33 +582,52 @@ def load_actions_from_config():
                     action_type = "submenu"
                     icon = "easy_switch"
                     submenu = EASY_SWITCH_SUBMENU
-                    print(
-                        "Easy-Switch shortcuts enabled - replacing Emoji with Easy-Switch submenu"
+                    logger.info(
+                        "Easy-Switch shortcuts enabled - replacing Emoji with Easy-Switch submenu",
                     )
 
-                actions.append((label, action_type, command, color, icon, submenu))
+                actions.append(Action(label, action_type, command, color, icon, submenu))
 
-            print(f"Loaded {len(actions)} actions from config")
-            return actions
+            logger.info("Loaded %s actions from config", len(actions))
+            return tuple(actions)
 
     except Exception as e:
-        print(f"Error loading actions from config: {e}")
+        logger.error("Error loading actions from config: %s", e)
 
     return DEFAULT_ACTIONS
 
 
+def submenu_table(actions):
+    """Per-slice submenu items, or None for slices that don't open one.
+
+    Kept alongside ACTIONS so hover checks are a single index + identity test.
+    """
+    return tuple(
+        (action.submenu or None) if action.kind == "submenu" else None
+        for action in actions
+    )
+
+
 # Load actions at startup
 ACTIONS = load_actions_from_config()
+ACTION_SUBMENUS = submenu_table(ACTIONS)
 
 # =============================================================================
 # AI SUBMENU ICONS (SVG)
 # =============================================================================
-AI_ICONS = {}
+AI_ICON_FILES = {
+    "claude": "ai-claude.svg",
+    "chatgpt": "ai-chatgpt.svg",
+    "gemini": "ai-gemini.svg",
+    "perplexity": "ai-perplexity.svg",
+}
+
+# Renderers parsed so far (None = missing/invalid, so the fallback is cached too)
+_AI_ICONS = {}
 
 
-def load_ai_icons():
-    """Load SVG icons for AI submenu items."""
-    global AI_ICONS
+@lru_cache(maxsize=1)
+def _ai_assets_dir():
     # Search multiple paths: dev layout (../assets) and installed (/usr/share/juhradial/assets)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     search_dirs = [
@@ -433,42 +635,128 @@ def load_ai_icons():
         os.path.join(script_dir, "assets"),  # installed: /usr/share/juhradial/assets
         "/usr/share/juhradial/assets",  # absolute fallback
     ]
-    assets_dir = next((d for d in search_dirs if os.path.isdir(d)), search_dirs[0])
+    return next((d for d in search_dirs if os.path.isdir(d)), search_dirs[0])
 
-    icon_files = {
-        "claude": "ai-claude.svg",
-        "chatgpt": "ai-chatgpt.svg",
-        "gemini": "ai-gemini.svg",
-        "perplexity": "ai-perplexity.svg",
-    }
 
-    for name, filename in icon_files.items():
-        path = os.path.join(assets_dir, filename)
+def get_ai_icon(name):
+    """SVG renderer for an AI submenu icon, or None to use the drawn icon.
+
+    Parsed on first use - most sessions never open the AI submenu.
+    """
+    try:
+        return _AI_ICONS[name]
+    except KeyError:
+        pass
+
+    renderer = None
+    filename = AI_ICON_FILES.get(name)
+    if filename is not None:
+        path = os.path.join(_ai_assets_dir(), filename)
         if os.path.exists(path):
             renderer = QSvgRenderer(path)
             if renderer.isValid():
-                AI_ICONS[name] = renderer
-                print(f"Loaded AI icon: {name}")
+                logger.debug("Loaded AI icon: %s", name)
             else:
-                print(f"Failed to load AI icon: {path}")
+                logger.warning("Failed to load AI icon: %s", path)
+                renderer = None
         else:
-            print(f"AI icon not found: {path}")
+            logger.warning("AI icon not found: %s", path)
+    _AI_ICONS[name] = renderer
+    return renderer
 
 
-def open_settings():
-    """Launch the settings dashboard (GTK4 handles single-instance via D-Bus)"""
-    # GTK4/Adwaita application handles single-instance automatically
-    # If settings is already running, it will activate the existing window
-    settings_script = os.path.join(os.path.dirname(__file__), "settings_dashboard.py")
+DAEMON_BUS_NAME = "org.kde.juhradialmx"
+DAEMON_OBJECT_PATH = "/org/kde/juhradialmx/Daemon"
+DAEMON_INTERFACE = "org.kde.juhradialmx.Daemon"
+
+
+class DaemonInterface(QDBusAbstractInterface):
+    """Typed proxy for the daemon object.
+
+    Declaring the daemon's signals here lets Qt relay them as ordinary
+    signals, and unlike QDBusInterface nothing is introspected at creation.
+    isValid() follows the daemon's bus name, so a restarted daemon is picked
+    up without recreating the proxy.
+    """
+
+    MenuRequested = pyqtSignal(int, int)
+    HideMenu = pyqtSignal()
+    CursorMoved = pyqtSignal(int, int)
+
+    def __init__(self, connection, parent=None):
+        super().__init__(
+            DAEMON_BUS_NAME, DAEMON_OBJECT_PATH, DAEMON_INTERFACE, connection, parent
+        )
+
+    def trigger_haptic(self, event):
+        # Fire-and-forget - the menu never waits on the daemon's reply
+        self.call(QDBus.CallMode.NoBlock, "TriggerHaptic", event)
+
+    def menu_closed(self):
+        # Stops the daemon's CursorMoved stream for a toggle-mode menu
+        self.call(QDBus.CallMode.NoBlock, "MenuClosed")
+
+
+# Settings dashboard is a GApplication - it exports org.freedesktop.Application
+# and org.gtk.Actions on the session bus under its application id
+SETTINGS_BUS_NAME = "org.kde.juhradialmx.settings"
+SETTINGS_OBJECT_PATH = "/org/kde/juhradialmx/settings"
+
+
+def _settings_running():
+    """Check whether the settings dashboard owns its bus name (no process scan)"""
+    reply = QDBusConnection.sessionBus().interface().isServiceRegistered(
+        SETTINGS_BUS_NAME
+    )
+    return reply.isValid() and reply.value()
+
+
+def _call_settings_app(interface, method, *args):
+    """Call a method on the running settings dashboard. Returns True on success."""
+    msg = QDBusMessage.createMethodCall(
+        SETTINGS_BUS_NAME, SETTINGS_OBJECT_PATH, interface, method
+    )
+    msg.setArguments(list(args))
+    # Never let the bus try to activate the dashboard just to deliver this
+    msg.setAutoStartService(False)
+    reply = QDBusConnection.sessionBus().call(msg, QDBus.CallMode.Block, 500)
+    return reply.type() != QDBusMessage.MessageType.ErrorMessage
+
+
+@lru_cache(maxsize=64)
+def command_argv(cmd):
+    """Split an exec command once (shlex, no shell); ValueError on bad syntax"""
+    return tuple(shlex.split(cmd))
+
+
+def spawn_detached(argv):
+    """Launch a program directly in its own session, output discarded"""
     subprocess.Popen(
-        ["python3", settings_script],
+        argv,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
+        start_new_session=True,
     )
 
 
+def open_settings():
+    """Raise the settings dashboard, launching it only if it isn't running"""
+    # Running instance: one D-Bus message instead of spawning a new
+    # python3 + GTK process just to forward the activation
+    if _settings_running() and _call_settings_app(
+        "org.freedesktop.Application", "Activate", {}
+    ):
+        return
+
+    settings_script = os.path.join(os.path.dirname(__file__), "settings_dashboard.py")
+    spawn_detached(["python3", settings_script])
+
+
 class RadialMenu(QWidget):
-    # Tap threshold in milliseconds - below this is considered a "tap" (toggle mode)
+    # Tap threshold in milliseconds - below this is considered a "tap" (toggle mode).
+    # Must match TOGGLE_TAP_MS in daemon/src/evdev.rs, which decides when the
+    # daemon keeps streaming CursorMoved after release (_close_menu's
+    # MenuClosed call ends that stream even if the two timers disagree)
     TAP_THRESHOLD_MS = 250
 
     def __init__(self):
@@ -487,6 +775,8 @@ class RadialMenu(QWidget):
         self.setWindowTitle("JuhRadial MX")  # For window rule matching (Hyprland, etc.)
 
         self.highlighted_slice = -1
+        # Last offset fed to _update_hover; a repeat cannot change the highlight
+        self._last_hover = None
         self.menu_center_x = 0
         self.menu_center_y = 0
 
@@ -494,49 +784,55 @@ class RadialMenu(QWidget):
         self.submenu_active = False  # True when showing a submenu
         self.submenu_slice = -1  # Which main slice has active submenu
         self.highlighted_subitem = -1  # Which sub-item is highlighted (-1 = none)
+        self._subitem_xy = []  # Subitem offsets from center, set on activation
+        self._subitem_rects = []  # Repaint rect of each item
+        self._subitem_points = []  # Item centers in window coords (QPointF)
+        self._subitem_shadow_points = []
+        self._subitem_icon_points = []  # Pixel-aligned top-left of each SVG icon
+        self._submenu_region = QRegion()  # Window area covered by the items
 
         # Toggle mode: True when menu was opened with a quick tap and stays open
         self.toggle_mode = False
         # Track when menu was shown (for tap detection)
-        self.show_time = None
+        self._show_timer = QElapsedTimer()
+
+        # Center label cache - text layout and its sized font are computed once
+        # per label and cleared whenever theme/translations are reloaded
+        self._center_text_pen = None
+        self._center_layout_cache = {}
+        # Squared dead-zone radius for hit-testing (theme-dependent)
+        self._center_sq = self._get_center_radius() ** 2
+
+        # Per-slice repaint regions - a hover change only touches two slices
+        # and the center label, the rest of the window never changes
+        self._slice_rects = [self._slice_bounds(i) for i in range(8)]
+        self._slice_regions = [QRegion(r) for r in self._slice_rects]
+        self._last_painted_slice = -1
+        self._painted_submenu = False
+        self._painted_submenu_region = QRegion()
+
+        # Cached static layers: background only, and background + idle slices.
+        # Rebuilt when theme/actions change, hover only redraws one slice.
+        self._bg_pixmap = None
+        self._base_pixmap = None
+        self._base_key = None
+        self._theme_name = None  # Theme COLORS was last reloaded with (on_show)
+        self._sector_paths = []  # Per-slice restore clip, excludes center disk
+        self._outside_center = None  # Clip for live highlight drawing
+        # Vector icons rasterized once per (icon, size, color, scale, DPI)
+        self._icon_cache = {}
 
         # D-Bus setup
         bus = QDBusConnection.sessionBus()
-        bus.connect(
-            "org.kde.juhradialmx",
-            "/org/kde/juhradialmx/Daemon",
-            "org.kde.juhradialmx.Daemon",
-            "MenuRequested",
-            "ii",
-            self.on_show,
-        )
-        # Listen for HideMenu without parameters - we track duration ourselves
-        bus.connect(
-            "org.kde.juhradialmx",
-            "/org/kde/juhradialmx/Daemon",
-            "org.kde.juhradialmx.Daemon",
-            "HideMenu",
-            "",
-            self.on_hide,
-        )
-        bus.connect(
-            "org.kde.juhradialmx",
-            "/org/kde/juhradialmx/Daemon",
-            "org.kde.juhradialmx.Daemon",
-            "CursorMoved",
-            "ii",
-            self.on_cursor_moved,
-        )
 
-        # D-Bus interface for calling daemon methods (haptic feedback)
-        self.daemon_iface = QDBusInterface(
-            "org.kde.juhradialmx",
-            "/org/kde/juhradialmx/Daemon",
-            "org.kde.juhradialmx.Daemon",
-            bus,
-        )
-        print(
-            f"[DBUS] D-Bus interface created - isValid: {self.daemon_iface.isValid()}"
+        # Daemon signals and method calls (haptic feedback) share one proxy
+        self.daemon_iface = DaemonInterface(bus, self)
+        self.daemon_iface.MenuRequested.connect(self.on_show)
+        # HideMenu has no parameters - we track duration ourselves
+        self.daemon_iface.HideMenu.connect(self.on_hide)
+        self.daemon_iface.CursorMoved.connect(self.on_cursor_moved)
+        logger.debug(
+            "[DBUS] D-Bus interface created - isValid: %s", self.daemon_iface.isValid()
         )
 
         # Fade animation
@@ -544,21 +840,32 @@ class RadialMenu(QWidget):
         self.anim.setDuration(180)
         self.anim.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Cursor polling timer for toggle mode (tracks cursor position when menu stays open)
+        # Cursor sampling timer for toggle mode (tracks cursor position when menu stays open).
+        # Repeats at ~60fps only as a fallback - once the daemon streams CursorMoved
+        # in toggle mode it becomes single-shot and is re-armed by motion events.
         self.cursor_timer = QTimer(self)
         self.cursor_timer.timeout.connect(self._poll_cursor)
         self.cursor_timer.setInterval(16)  # ~60fps
 
-        print("=" * 60, flush=True)
-        print("  JuhRadial MX - PyQt6 Overlay", flush=True)
-        print("=" * 60, flush=True)
-        print("\n  Modes:", flush=True)
-        print(f"    Hold + release: Execute action on release", flush=True)
-        print(
-            f"    Quick tap (<{self.TAP_THRESHOLD_MS}ms): Menu stays open, click to select",
-            flush=True,
+        # Hold-mode CursorMoved and toggle-mode mouseMoveEvent can arrive at
+        # the mouse's report rate (up to 1000 Hz); keep only the latest offset
+        # and apply it at most every 8ms
+        self._pending_cursor = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(8)
+        self._coalesce_timer.timeout.connect(self._apply_pending_cursor)
+
+        logger.info("=" * 60)
+        logger.info("  JuhRadial MX - PyQt6 Overlay")
+        logger.info("=" * 60)
+        logger.info("  Modes:")
+        logger.info("    Hold + release: Execute action on release")
+        logger.info(
+            "    Quick tap (<%sms): Menu stays open, click to select",
+            self.TAP_THRESHOLD_MS,
         )
-        print("\n  Actions (clockwise from top):", flush=True)
+        logger.info("  Actions (clockwise from top):")
         directions = [
             "Top",
             "Top-Right",
@@ -570,32 +877,35 @@ class RadialMenu(QWidget):
             "Top-Left",
         ]
         for i, action in enumerate(ACTIONS):
-            print(f"    {directions[i]:12} -> {action[0]}", flush=True)
-        print("\n" + "=" * 60 + "\n", flush=True)
+            logger.info("    %-12s -> %s", directions[i], action.label)
+        logger.info("=" * 60)
 
     @pyqtSlot(int, int)
     def on_show(self, x, y):
-        import time
-
         # Reload translations for language changes
         global _
-        from i18n import setup_i18n
-
         _ = setup_i18n()
 
-        global ACTIONS
+        global ACTIONS, ACTION_SUBMENUS
 
         # Reload actions, theme, and translations from config each time menu is shown
         # This ensures changes from settings are picked up immediately
         ACTIONS = load_actions_from_config()
+        ACTION_SUBMENUS = submenu_table(ACTIONS)
 
-        global COLORS, RADIAL_IMAGE, RADIAL_PARAMS
-        COLORS = load_theme()
+        global RADIAL_IMAGE, RADIAL_PARAMS
+        # Read the theme name once per show; the static-layer cache key uses
+        # this value so it always agrees with the palette loaded here
+        self._theme_name = load_theme_name()
+        COLORS.reload(self._theme_name)
         load_radial_image()
+        self._center_sq = self._get_center_radius() ** 2
+        self._center_text_pen = None
+        self._center_layout_cache.clear()
 
         # If already in toggle mode and menu is visible, this is a second tap to close
         if self.toggle_mode and self.isVisible():
-            print("OVERLAY: Second tap detected - closing menu")
+            logger.info("OVERLAY: Second tap detected - closing menu")
             self._close_menu(execute=False)
             return
 
@@ -606,18 +916,23 @@ class RadialMenu(QWidget):
             fresh_pos = get_cursor_position_hyprland()
             if fresh_pos:
                 x, y = fresh_pos
-                print(f"OVERLAY: Hyprland fresh cursor position: ({x}, {y})")
+                logger.debug("OVERLAY: Hyprland fresh cursor position: (%s, %s)", x, y)
 
         # Detect which monitor the cursor is on and clamp menu to it
         if IS_HYPRLAND:
             mon = get_monitor_at_cursor(x, y)
-            print(
-                f"OVERLAY: Monitor: {mon['name']} ({mon['width']}x{mon['height']} at {mon['x']},{mon['y']})"
+            logger.debug(
+                "OVERLAY: Monitor: %s (%sx%s at %s,%s)",
+                mon["name"],
+                mon["width"],
+                mon["height"],
+                mon["x"],
+                mon["y"],
             )
         else:
             mon = None
 
-        print(f"OVERLAY: MenuRequested at ({x}, {y})")
+        logger.info("OVERLAY: MenuRequested at (%s, %s)", x, y)
 
         # Clamp menu position to stay within the active monitor
         half = WINDOW_SIZE // 2
@@ -628,7 +943,7 @@ class RadialMenu(QWidget):
         self.menu_center_x = x
         self.menu_center_y = y
         self.toggle_mode = False  # Reset toggle mode on new show
-        self.show_time = time.time()  # Track when menu was shown
+        self._show_timer.start()  # Track when menu was shown (monotonic)
 
         # Reset submenu state
         self.submenu_active = False
@@ -638,6 +953,7 @@ class RadialMenu(QWidget):
         # Move window so menu is centered at x, y
         self.move(x - half, y - half)
         self.highlighted_slice = -1
+        self._last_hover = None
 
         self.show()
         self.raise_()
@@ -651,20 +967,6 @@ class RadialMenu(QWidget):
         self.anim.setEndValue(1.0)
         self.anim.start()
 
-        # Verify D-Bus interface is still valid (in case daemon restarted)
-        if not self.daemon_iface.isValid():
-            print("[DBUS] D-Bus interface invalid, recreating...")
-            bus = QDBusConnection.sessionBus()
-            self.daemon_iface = QDBusInterface(
-                "org.kde.juhradialmx",
-                "/org/kde/juhradialmx/Daemon",
-                "org.kde.juhradialmx.Daemon",
-                bus,
-            )
-            print(
-                f"[DBUS] D-Bus interface recreated - isValid: {self.daemon_iface.isValid()}"
-            )
-
         # Trigger haptic feedback for menu appearance
         self._trigger_haptic("menu_appear")
 
@@ -678,40 +980,40 @@ class RadialMenu(QWidget):
         Args:
             event: One of "menu_appear", "slice_change", "confirm", "invalid"
         """
-        print(
-            f"[HAPTIC] _trigger_haptic called: event={event}, iface_valid={self.daemon_iface.isValid()}"
+        logger.debug(
+            "[HAPTIC] _trigger_haptic called: event=%s, iface_valid=%s",
+            event,
+            self.daemon_iface.isValid(),
         )
         if self.daemon_iface.isValid():
-            reply = self.daemon_iface.call("TriggerHaptic", event)
-            if reply.type() == reply.MessageType.ErrorMessage:
-                print(
-                    f"[HAPTIC] D-Bus call failed: {reply.errorName()} - {reply.errorMessage()}"
-                )
-            else:
-                print(f"[HAPTIC] D-Bus call succeeded for {event}")
+            self.daemon_iface.trigger_haptic(event)
         else:
-            print(
-                f"[HAPTIC] ERROR: daemon_iface is INVALID - cannot send haptic signal"
+            logger.warning(
+                "[HAPTIC] ERROR: daemon_iface is INVALID - cannot send haptic signal"
             )
 
     @pyqtSlot()
     def on_hide(self):
         """Handle HideMenu signal - determine tap vs hold based on time elapsed."""
-        import time
+        # Release acts on the highlight, so apply any motion still queued
+        self._coalesce_timer.stop()
+        self._apply_pending_cursor()
 
         # Calculate how long the menu was shown
-        if self.show_time:
-            duration_ms = (time.time() - self.show_time) * 1000
+        if self._show_timer.isValid():
+            duration_ms = self._show_timer.elapsed()
         else:
-            duration_ms = 1000  # Default to hold mode if no time recorded
+            duration_ms = self.TAP_THRESHOLD_MS  # Default to hold mode if no time recorded
 
-        print(f"OVERLAY: HideMenu received (duration={duration_ms:.0f}ms)")
+        logger.info("OVERLAY: HideMenu received (duration=%sms)", duration_ms)
 
         if duration_ms < self.TAP_THRESHOLD_MS:
             # Quick tap - enter toggle mode
-            print(f"OVERLAY: Quick tap detected - entering toggle mode")
+            logger.info("OVERLAY: Quick tap detected - entering toggle mode")
             self.toggle_mode = True
             # Start cursor polling for hover detection in toggle mode
+            # (switches to motion-driven sampling on the first CursorMoved)
+            self.cursor_timer.setSingleShot(False)
             self.cursor_timer.start()
             # Menu stays open - user will click to select or tap again to close
         else:
@@ -721,52 +1023,176 @@ class RadialMenu(QWidget):
     @pyqtSlot(int, int)
     def on_cursor_moved(self, dx, dy):
         """Handle cursor movement from daemon (relative to menu center)."""
+        if not self.isVisible():
+            return
+
+        if self.toggle_mode:
+            # Daemon keeps streaming motion after a quick tap - sample the real
+            # cursor position once per frame of motion instead of polling
+            # continuously while the cursor sits still
+            self.cursor_timer.setSingleShot(True)
+            if not self.cursor_timer.isActive():
+                self.cursor_timer.start()
+            return
+
         # dx, dy are relative offsets from menu center (button press point)
-        distance = math.hypot(dx, dy)
-        center_radius = self._get_center_radius()
+        self._queue_cursor(dx, dy, "HOVER-HOLD", False)
+
+    def _queue_cursor(self, dx, dy, tag, submenus):
+        """Record the latest cursor offset and schedule one coalesced update"""
+        self._pending_cursor = (dx, dy, tag, submenus)
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    def _apply_pending_cursor(self):
+        """Run the hover update for the latest coalesced cursor offset"""
+        pending = self._pending_cursor
+        if pending is None:
+            return
+        self._pending_cursor = None
+        if self.isVisible():
+            dx, dy, tag, submenus = pending
+            self._update_hover(dx, dy, tag, submenus=submenus)
+
+    def _slice_bounds(self, index):
+        """Bounding rect (window coords) of a slice including icon and outline"""
+        c = WINDOW_SIZE / 2
+        start = index * 45 - 22.5 - 90
+        xs = []
+        ys = []
+        for angle, r in (
+            (start, CENTER_ZONE_RADIUS),
+            (start + 45, CENTER_ZONE_RADIUS),
+            (start, MENU_RADIUS),
+            (start + 22.5, MENU_RADIUS),
+            (start + 45, MENU_RADIUS),
+        ):
+            xs.append(c + r * cos(radians(angle)))
+            ys.append(c + r * sin(radians(angle)))
+        pad = 6
+        left = int(min(xs)) - pad
+        top = int(min(ys)) - pad
+        return QRect(left, top, int(max(xs)) + pad - left, int(max(ys)) + pad - top)
+
+    def _slice_sector(self, index):
+        """Pie sector from the center through a slice, out to the window edge"""
+        c = WINDOW_SIZE / 2
+        r = WINDOW_SIZE
+        start = index * 45 - 22.5 - 90
+        path = QPainterPath()
+        path.moveTo(c, c)
+        path.arcTo(QRectF(c - r, c - r, r * 2, r * 2), -start, -45)
+        path.closeSubpath()
+        return path
 
-        if distance < center_radius or distance > MENU_RADIUS:
-            new_slice = -1
+    def _new_layer(self):
+        """Transparent window-sized pixmap matching the screen's pixel ratio"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(WINDOW_SIZE * dpr), int(WINDOW_SIZE * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    def _ensure_base_pixmaps(self):
+        """Render the static menu layers if theme, actions or DPI changed"""
+        key = (self._theme_name, ACTIONS, self.devicePixelRatioF())
+        if self._base_pixmap is not None and key == self._base_key:
+            return
+
+        cx = cy = WINDOW_SIZE / 2
+        self._icon_cache.clear()
+
+        self._bg_pixmap = self._new_layer()
+        p = QPainter(self._bg_pixmap)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_background(p, cx, cy)
+        p.end()
+
+        self._base_pixmap = QPixmap(self._bg_pixmap)
+        p = QPainter(self._base_pixmap)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if RADIAL_IMAGE is not None:
+            for i in range(8):
+                self._draw_3d_icon(p, cx, cy, i, False)
         else:
-            # Calculate angle from relative position
-            angle = math.degrees(math.atan2(dx, -dy))
-            if angle < 0:
-                angle += 360
-            new_slice = int((angle + 22.5) / 45) % 8
+            self._draw_idle_slices(p, cx, cy)
+        border_w = self._draw_center_disk(p, cx, cy)
+        p.end()
 
-        if new_slice != self.highlighted_slice:
-            print(
-                f"[HOVER-HOLD] on_cursor_moved: slice changed from {self.highlighted_slice} to {new_slice}"
-            )
-            # Trigger haptic for slice change (only when entering a valid slice)
-            if new_slice >= 0:
-                self._trigger_haptic("slice_change")
-            self.highlighted_slice = new_slice
-            self.update()
+        # The center disk is part of the cached layer now, so live drawing
+        # around the highlighted slice must leave it untouched
+        reach = self._get_center_radius() + border_w / 2 + 1
+        center_disk = QPainterPath()
+        center_disk.addEllipse(QPointF(cx, cy), reach, reach)
+        window = QPainterPath()
+        window.addRect(QRectF(0, 0, WINDOW_SIZE, WINDOW_SIZE))
+        self._outside_center = window.subtracted(center_disk)
+        self._sector_paths = [
+            self._slice_sector(i).subtracted(center_disk) for i in range(8)
+        ]
+
+        self._base_key = key
+
+    def _center_region(self):
+        c = WINDOW_SIZE // 2
+        r = int(self._get_center_radius()) + 4
+        return QRegion(c - r, c - r, r * 2, r * 2)
+
+    def _update_highlight(self):
+        """Schedule a repaint for a highlighted slice or submenu change"""
+        region = self._center_region()
+        for index in (self._last_painted_slice, self.highlighted_slice):
+            if index >= 0:
+                region = region.united(self._slice_regions[index])
+        # Submenu items live outside the slice regions
+        if self._painted_submenu:
+            region = region.united(self._painted_submenu_region)
+        if self.submenu_active:
+            region = region.united(self._submenu_region)
+        self.update(region)
+
+    def _update_subitem(self, previous):
+        """Schedule a repaint for a subitem highlight change (items + label)"""
+        region = self._center_region()
+        for index in (previous, self.highlighted_subitem):
+            if 0 <= index < len(self._subitem_rects):
+                region = region.united(self._subitem_rects[index])
+        self.update(region)
 
     def _close_menu(self, execute=True):
         self.cursor_timer.stop()
+        self._coalesce_timer.stop()
+        if execute:
+            # A click acts on the highlight, so apply any motion still queued
+            self._apply_pending_cursor()
+        self._pending_cursor = None
         self.toggle_mode = False  # Reset toggle mode
 
-        print(
-            f"_close_menu: execute={execute}, submenu_active={self.submenu_active}, subitem={self.highlighted_subitem}, slice={self.highlighted_slice}"
+        logger.debug(
+            "_close_menu: execute=%s, submenu_active=%s, subitem=%s, slice=%s",
+            execute,
+            self.submenu_active,
+            self.highlighted_subitem,
+            self.highlighted_slice,
         )
 
         if execute:
             if self.submenu_active and self.highlighted_subitem >= 0:
                 # Execute submenu item
-                submenu = ACTIONS[self.submenu_slice][5]
-                print(
-                    f"_close_menu: Executing submenu item {self.highlighted_subitem} from slice {self.submenu_slice}"
+                submenu = ACTION_SUBMENUS[self.submenu_slice]
+                logger.debug(
+                    "_close_menu: Executing submenu item %s from slice %s",
+                    self.highlighted_subitem,
+                    self.submenu_slice,
                 )
                 if submenu and self.highlighted_subitem < len(submenu):
                     subitem = submenu[self.highlighted_subitem]
-                    print(f"_close_menu: Subitem = {subitem}")
+                    logger.debug("_close_menu: Subitem = %s", subitem)
                     self._trigger_haptic("confirm")  # Haptic for selection confirm
                     self._execute_subaction(subitem)
             elif self.highlighted_slice >= 0:
                 action = ACTIONS[self.highlighted_slice]
-                if action[1] == "submenu":
+                if action.kind == "submenu":
                     # Don't execute, show submenu instead (handled in toggle mode)
                     pass
                 else:
@@ -778,37 +1204,27 @@ class RadialMenu(QWidget):
         self.submenu_slice = -1
         self.highlighted_subitem = -1
         self.hide()
+        self.daemon_iface.menu_closed()
 
     def _execute_action(self, action):
-        label, cmd_type, cmd = action[0], action[1], action[2]
-        print(f"Executing: {label}")
+        label, cmd_type, cmd = action.label, action.kind, action.command
+        logger.info("Executing: %s", label)
 
         try:
             if cmd_type == "exec":
                 # Use shlex.split for safe command parsing (avoids shell injection)
                 try:
-                    cmd_args = shlex.split(cmd)
-                    subprocess.Popen(
-                        cmd_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                    )
+                    spawn_detached(command_argv(cmd))
                 except ValueError as e:
-                    print(f"Invalid command syntax: {cmd} - {e}")
+                    logger.warning("Invalid command syntax: %s - %s", cmd, e)
             elif cmd_type == "url":
                 # Ensure cmd doesn't start with - to prevent option injection
                 if cmd.startswith("-"):
-                    print(f"Invalid URL (starts with -): {cmd}")
+                    logger.warning("Invalid URL (starts with -): %s", cmd)
                 else:
-                    subprocess.Popen(
-                        ["xdg-open", cmd],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
+                    spawn_detached(["xdg-open", cmd])
             elif cmd_type == "emoji":
-                subprocess.Popen(
-                    ["plasma-emojier"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                spawn_detached(["plasma-emojier"])
             elif cmd_type == "settings":
                 # Launch settings (uses singleton check defined at module level)
                 open_settings()
@@ -817,53 +1233,48 @@ class RadialMenu(QWidget):
                 self.submenu_active = True
                 self.submenu_slice = self.highlighted_slice
                 self.highlighted_subitem = -1
-                self.update()
+                self._rebuild_subitem_positions()
+                self._update_highlight()
                 return  # Don't close menu
         except Exception as e:
-            print(f"Error executing action: {e}")
+            logger.error("Error executing action: %s", e)
 
     def _execute_subaction(self, subitem):
         """Execute a submenu item action."""
-        label, cmd_type, cmd = subitem[0], subitem[1], subitem[2]
-        print(f"Executing submenu: {label}")
+        label, cmd_type, cmd = subitem.label, subitem.kind, subitem.command
+        logger.info("Executing submenu: %s", label)
 
         try:
             if cmd_type == "exec":
                 # Use shlex.split for safe command parsing (avoids shell injection)
                 try:
-                    cmd_args = shlex.split(cmd)
-                    subprocess.Popen(
-                        cmd_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                    )
+                    spawn_detached(command_argv(cmd))
                 except ValueError as e:
-                    print(f"Invalid command syntax: {cmd} - {e}")
+                    logger.warning("Invalid command syntax: %s - %s", cmd, e)
             elif cmd_type == "url":
                 # Ensure cmd doesn't start with - to prevent option injection
                 if cmd.startswith("-"):
-                    print(f"Invalid URL (starts with -): {cmd}")
+                    logger.warning("Invalid URL (starts with -): %s", cmd)
                 else:
-                    subprocess.Popen(
-                        ["xdg-open", cmd],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
+                    spawn_detached(["xdg-open", cmd])
             elif cmd_type == "easy_switch":
                 # Switch to host via D-Bus call to daemon
                 # Validate host_index (Easy-Switch supports 0-2 for 3 hosts)
                 try:
                     host_index = int(cmd)
                     if not 0 <= host_index <= 2:
-                        print(
-                            f"Easy-Switch: Invalid host index {host_index}, must be 0-2"
+                        logger.warning(
+                            "Easy-Switch: Invalid host index %s, must be 0-2",
+                            host_index,
                         )
                         self._trigger_haptic("invalid")
                         return
                 except ValueError:
-                    print(f"Easy-Switch: Invalid host index format: {cmd}")
+                    logger.warning("Easy-Switch: Invalid host index format: %s", cmd)
                     self._trigger_haptic("invalid")
                     return
 
-                print(f"Easy-Switch: Switching to host {host_index}")
+                logger.info("Easy-Switch: Switching to host %s", host_index)
                 # Use gdbus for reliable D-Bus call with proper byte typing
                 # PyQt6 QDBusMessage doesn't properly handle byte (y) signature
                 try:
@@ -885,20 +1296,23 @@ class RadialMenu(QWidget):
                         timeout=5,
                     )
                     if result.returncode == 0:
-                        print(
-                            f"Easy-Switch: Successfully requested switch to host {host_index}"
+                        logger.info(
+                            "Easy-Switch: Successfully requested switch to host %s",
+                            host_index,
                         )
                     else:
-                        print(f"Easy-Switch D-Bus error: {result.stderr.strip()}")
+                        logger.warning(
+                            "Easy-Switch D-Bus error: %s", result.stderr.strip()
+                        )
                         self._trigger_haptic("invalid")
                 except subprocess.TimeoutExpired:
-                    print("Easy-Switch: D-Bus call timed out")
+                    logger.warning("Easy-Switch: D-Bus call timed out")
                     self._trigger_haptic("invalid")
                 except Exception as e:
-                    print(f"Easy-Switch D-Bus error: {e}")
+                    logger.warning("Easy-Switch D-Bus error: %s", e)
                     self._trigger_haptic("invalid")
         except Exception as e:
-            print(f"Error executing subaction: {e}")
+            logger.error("Error executing subaction: %s", e)
 
     def _poll_cursor(self):
         """Poll cursor position for hover detection."""
@@ -911,164 +1325,152 @@ class RadialMenu(QWidget):
 
         dx = pos_x - cx
         dy = pos_y - cy
-        distance = math.hypot(dx, dy)
-        center_radius = self._get_center_radius()
+        self._update_hover(dx, dy, "HOVER-TOGGLE")
+
+    def _update_hover(self, dx, dy, tag, submenus=True):
+        """Update slice/subitem highlight for a cursor offset from center.
+
+        Shared by every cursor source and schedules at most one repaint.
+        Hold mode passes submenus=False and only tracks the main ring.
+        """
+        # Toggle-mode polling keeps reporting a resting cursor; the hover
+        # state is a pure function of the offset, so repeats are no-ops
+        hover = (dx, dy, submenus)
+        if hover == self._last_hover:
+            return
+        self._last_hover = hover
+
+        dist_sq = dx * dx + dy * dy
+        center_sq = self._center_sq
+        reach_sq = SUBMENU_REACH_SQ if submenus else MENU_RADIUS_SQ
 
         # Calculate which slice we're over
-        if (
-            distance < center_radius or distance > MENU_RADIUS + 60
-        ):  # Extended range for submenu
+        if dist_sq < center_sq or dist_sq > reach_sq:
             new_slice = -1
         else:
-            angle = math.degrees(math.atan2(dx, -dy))
-            if angle < 0:
-                angle += 360
-            new_slice = int((angle + 22.5) / 45) % 8
+            new_slice = slice_index(dx, dy)
 
         # Check submenu items if submenu is active
+        was_submenu = self.submenu_active
         if self.submenu_active:
-            subitem = self._get_subitem_at_position(dx, dy)
+            subitem = self._get_subitem_at_position(dx, dy, dist_sq)
             if subitem >= 0:
                 # Hovering a subitem
                 if subitem != self.highlighted_subitem:
+                    previous = self.highlighted_subitem
                     self.highlighted_subitem = subitem
-                    self.update()
+                    self._update_subitem(previous)
                 return
             # Not over a subitem - check if we're still near parent slice
-            if new_slice == self.submenu_slice or distance > MENU_RADIUS:
+            if new_slice == self.submenu_slice or dist_sq > MENU_RADIUS_SQ:
                 # Still in submenu area (over parent or in extended range)
-                self.highlighted_subitem = -1
-                self.update()
+                if self.highlighted_subitem >= 0:
+                    previous = self.highlighted_subitem
+                    self.highlighted_subitem = -1
+                    self._update_subitem(previous)
                 return
-            else:
-                # Moved to different slice - deactivate submenu
-                self.submenu_active = False
-                self.submenu_slice = -1
-                self.highlighted_subitem = -1
+            # Moved to different slice - deactivate submenu
+            self.submenu_active = False
+            self.submenu_slice = -1
+            self.highlighted_subitem = -1
 
         # Check if hovering over a slice with submenu - activate it
-        if new_slice >= 0 and new_slice != self.highlighted_slice:
-            action = ACTIONS[new_slice]
-            if action[1] == "submenu" and action[5]:
+        if submenus and new_slice >= 0 and new_slice != self.highlighted_slice:
+            if ACTION_SUBMENUS[new_slice] is not None:
                 self.submenu_active = True
                 self.submenu_slice = new_slice
                 self.highlighted_subitem = -1
+                self._rebuild_subitem_positions()
 
         if new_slice != self.highlighted_slice:
-            print(
-                f"[HOVER-TOGGLE] _poll_cursor: slice changed from {self.highlighted_slice} to {new_slice}"
+            logger.debug(
+                "[%s] slice changed from %s to %s",
+                tag,
+                self.highlighted_slice,
+                new_slice,
             )
             # Trigger haptic for slice change (only when entering a valid slice)
             if new_slice >= 0:
                 self._trigger_haptic("slice_change")
             self.highlighted_slice = new_slice
-            self.update()
-        elif self.submenu_active:
-            self.update()
+            self._update_highlight()
+        elif self.submenu_active != was_submenu:
+            self._update_highlight()
 
-    def _get_subitem_at_position(self, dx, dy):
+    def _get_subitem_at_position(self, dx, dy, dist_sq):
         """Check if cursor is over a submenu item. Returns item index or -1."""
         if not self.submenu_active or self.submenu_slice < 0:
             return -1
-
-        submenu = ACTIONS[self.submenu_slice][5]
-        if not submenu:
+        # Inside the main ring (most motion) no subitem can be hit
+        if dist_sq < SUBITEM_RING_MIN_SQ or dist_sq > SUBITEM_RING_MAX_SQ:
             return -1
 
-        # Calculate parent slice angle
-        parent_angle = self.submenu_slice * 45 - 90
+        for i, (item_x, item_y) in enumerate(self._subitem_xy):
+            # Check if cursor is within this item
+            ox = dx - item_x
+            oy = dy - item_y
+            if ox * ox + oy * oy < SUBITEM_HIT_SQ:
+                return i
 
-        # Submenu items are positioned in an arc beyond the main menu
-        SUBMENU_RADIUS = MENU_RADIUS + 45  # Distance from center to submenu items
-        SUBITEM_SIZE = 32  # Size of each subitem circle
+        return -1
 
-        num_items = len(submenu)
-        spread = 15  # Degrees between items
+    def _rebuild_subitem_positions(self):
+        """Cache subitem offsets from center for the newly activated submenu"""
+        submenu = ACTION_SUBMENUS[self.submenu_slice] or ()
 
-        for i, item in enumerate(submenu):
-            # Calculate position of this subitem
-            offset = (i - (num_items - 1) / 2) * spread
-            item_angle = math.radians(parent_angle + offset)
-            item_x = SUBMENU_RADIUS * math.cos(item_angle)
-            item_y = SUBMENU_RADIUS * math.sin(item_angle)
+        # Submenu items are positioned in an arc beyond the main menu,
+        # centered on the parent slice
+        self._subitem_xy = submenu_offsets(self.submenu_slice, len(submenu))
 
-            # Check if cursor is within this item
-            dist_to_item = math.hypot(dx - item_x, dy - item_y)
-            if dist_to_item < SUBITEM_SIZE:
-                return i
+        c = WINDOW_SIZE / 2
+        self._subitem_points = [QPointF(c + ox, c + oy) for ox, oy in self._subitem_xy]
+        self._subitem_shadow_points = [
+            QPointF(c + ox + 2, c + oy + 3) for ox, oy in self._subitem_xy
+        ]
+        # Snap icon blits to whole pixels so the cached pixmap is copied
+        # 1:1 instead of being resampled at a fractional offset
+        half = SUBITEM_RADIUS * 0.7  # Icon is 1.4x the item radius
+        self._subitem_icon_points = [
+            QPoint(round(c + ox - half), round(c + oy - half))
+            for ox, oy in self._subitem_xy
+        ]
 
-        return -1
+        # Repaint area: each circle plus its drop shadow and hover glow ring
+        c = WINDOW_SIZE // 2
+        r = SUBITEM_RADIUS + 6
+        self._subitem_rects = [
+            QRect(int(c + ox) - r, int(c + oy) - r, r * 2 + 1, r * 2 + 1)
+            for ox, oy in self._subitem_xy
+        ]
+        region = QRegion()
+        for rect in self._subitem_rects:
+            region = region.united(rect)
+        self._submenu_region = region
 
     def mouseMoveEvent(self, event):
-        print(f"[MOUSE] mouseMoveEvent called - toggle_mode={self.toggle_mode}")
+        logger.debug("[MOUSE] mouseMoveEvent called - toggle_mode=%s", self.toggle_mode)
         cx = WINDOW_SIZE / 2
         cy = WINDOW_SIZE / 2
         pos = event.position()
         dx = pos.x() - cx
         dy = pos.y() - cy
-        distance = math.hypot(dx, dy)
-        center_radius = self._get_center_radius()
-
-        # Calculate which slice we're over
-        if distance < center_radius or distance > MENU_RADIUS + 60:
-            new_slice = -1
-        else:
-            angle = math.degrees(math.atan2(dx, -dy))
-            if angle < 0:
-                angle += 360
-            new_slice = int((angle + 22.5) / 45) % 8
-
-        # Check submenu items if submenu is active
-        if self.submenu_active:
-            subitem = self._get_subitem_at_position(dx, dy)
-            if subitem >= 0:
-                if subitem != self.highlighted_subitem:
-                    self.highlighted_subitem = subitem
-                    self.update()
-                return
-            # Not over a subitem - check if we're still near parent slice
-            if new_slice == self.submenu_slice or distance > MENU_RADIUS:
-                self.highlighted_subitem = -1
-                self.update()
-                return
-            else:
-                # Moved to different slice - deactivate submenu
-                self.submenu_active = False
-                self.submenu_slice = -1
-                self.highlighted_subitem = -1
-
-        # Check if hovering over a slice with submenu - activate it
-        if new_slice >= 0 and new_slice != self.highlighted_slice:
-            action = ACTIONS[new_slice]
-            if action[1] == "submenu" and action[5]:
-                self.submenu_active = True
-                self.submenu_slice = new_slice
-                self.highlighted_subitem = -1
-
-        if new_slice != self.highlighted_slice:
-            print(
-                f"[HOVER-MOUSE] mouseMoveEvent: slice changed from {self.highlighted_slice} to {new_slice}"
-            )
-            # Trigger haptic for slice change (only when entering a valid slice)
-            if new_slice >= 0:
-                self._trigger_haptic("slice_change")
-            self.highlighted_slice = new_slice
-            self.update()
-        elif self.submenu_active:
-            self.update()
+        self._queue_cursor(dx, dy, "HOVER-MOUSE", True)
 
     def mousePressEvent(self, event):
         """Handle mouse press - used in toggle mode for selection."""
         if self.toggle_mode:
             # In toggle mode, any click selects the current slice or closes
             if event.button() == Qt.MouseButton.LeftButton:
-                print(
-                    f"OVERLAY: Left click in toggle mode - slice={self.highlighted_slice}, submenu_active={self.submenu_active}, subitem={self.highlighted_subitem}"
+                logger.debug(
+                    "OVERLAY: Left click in toggle mode - slice=%s, submenu_active=%s, subitem=%s",
+                    self.highlighted_slice,
+                    self.submenu_active,
+                    self.highlighted_subitem,
                 )
                 self._close_menu(execute=True)
             else:
                 # Right-click or other button - close without executing
-                print("OVERLAY: Non-left click in toggle mode - closing")
+                logger.debug("OVERLAY: Non-left click in toggle mode - closing")
                 self._close_menu(execute=False)
 
     def mouseReleaseEvent(self, event):
@@ -1089,54 +1491,67 @@ class RadialMenu(QWidget):
         cx = WINDOW_SIZE / 2
         cy = WINDOW_SIZE / 2
 
-        if RADIAL_IMAGE is not None:
-            # === 3D Image Mode ===
-            # Draw the pre-rendered 3D radial wheel image centered
-            img_x = cx - RADIAL_IMAGE.width() / 2
-            img_y = cy - RADIAL_IMAGE.height() / 2
-            p.drawPixmap(int(img_x), int(img_y), RADIAL_IMAGE)
+        # Painting is clipped to the dirty area
+        dirty = event.rect()
+        self._last_painted_slice = self.highlighted_slice
+        self._painted_submenu = self.submenu_active
+        self._painted_submenu_region = self._submenu_region
 
-            # Draw highlight on hovered slice (translucent overlay)
-            if self.highlighted_slice >= 0:
-                self._draw_3d_slice_highlight(p, cx, cy, self.highlighted_slice)
+        # Background, idle slices and center disk come from the cached layer
+        self._ensure_base_pixmaps()
+        p.drawPixmap(0, 0, self._base_pixmap)
 
-            # Draw icons floating on the 3D image
-            for i in range(8):
-                self._draw_3d_icon(p, cx, cy, i)
-        else:
-            # === Vector Mode (original) ===
-            # Shadow
-            shadow_color = QColor(0, 0, 0, 100)
-            p.setBrush(QBrush(shadow_color))
-            p.setPen(Qt.PenStyle.NoPen)
-            p.drawEllipse(QPointF(cx + 4, cy + 6), MENU_RADIUS, MENU_RADIUS)
-
-            # Main background
-            base_color = QColor(COLORS["base"])
-            base_color.setAlpha(235)
-            p.setBrush(QBrush(base_color))
-            p.drawEllipse(QPointF(cx, cy), MENU_RADIUS, MENU_RADIUS)
-
-            # Border
-            border_color = QColor(COLORS["surface2"])
-            border_color.setAlpha(150)
-            p.setPen(QPen(border_color, 2))
-            p.setBrush(Qt.BrushStyle.NoBrush)
-            p.drawEllipse(QPointF(cx, cy), MENU_RADIUS, MENU_RADIUS)
-
-            # Draw slices
-            for i in range(8):
-                self._draw_slice(p, cx, cy, i)
+        # Redraw the hovered slice: restore the bare background under it,
+        # then paint it in its highlighted state
+        index = self.highlighted_slice
+        if index >= 0 and dirty.intersects(self._slice_rects[index]):
+            p.save()
+            p.setClipPath(self._sector_paths[index])
+            p.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            p.drawPixmap(0, 0, self._bg_pixmap)
+            p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            p.setClipPath(self._outside_center)
+            if RADIAL_IMAGE is not None:
+                self._draw_3d_slice_highlight(p, cx, cy, index)
+                self._draw_3d_icon(p, cx, cy, index, True)
+            else:
+                self._draw_slice(p, cx, cy, index, True)
+            p.restore()
 
         # Draw submenu if active (same for both modes)
         if self.submenu_active and self.submenu_slice >= 0:
             self._draw_submenu(p, cx, cy)
 
-        # Center zone (same for both modes)
-        self._draw_center(p, cx, cy)
+        # Center label (same for both modes)
+        self._draw_center_label(p, cx, cy)
 
         p.end()
 
+    def _draw_background(self, p, cx, cy):
+        """Draw the static wheel background (3D image, or vector disc)"""
+        if RADIAL_IMAGE is not None:
+            # === 3D Image Mode ===
+            # Draw the pre-rendered 3D radial wheel image centered
+            img_x = cx - RADIAL_IMAGE.width() / 2
+            img_y = cy - RADIAL_IMAGE.height() / 2
+            p.drawPixmap(int(img_x), int(img_y), RADIAL_IMAGE)
+            return
+
+        # === Vector Mode (original) ===
+        # Shadow
+        p.setBrush(cached_brush((0, 0, 0, 100)))
+        p.setPen(Qt.PenStyle.NoPen)
+        p.drawEllipse(QPointF(cx + 4, cy + 6), MENU_RADIUS, MENU_RADIUS)
+
+        # Main background
+        p.setBrush(cached_brush(COLORS["base"], 235))
+        p.drawEllipse(QPointF(cx, cy), MENU_RADIUS, MENU_RADIUS)
+
+        # Border
+        p.setPen(cached_pen(COLORS["surface2"], 2, 150))
+        p.setBrush(Qt.BrushStyle.NoBrush)
+        p.drawEllipse(QPointF(cx, cy), MENU_RADIUS, MENU_RADIUS)
+
     def _draw_3d_slice_highlight(self, p, cx, cy, index):
         """Draw a translucent highlight on the hovered slice for 3D mode."""
         params = RADIAL_PARAMS or {}
@@ -1145,31 +1560,10 @@ class RadialMenu(QWidget):
         fill_rgba = params.get("highlight_fill", (255, 255, 255, 45))
         border_rgba = params.get("highlight_border", (255, 255, 255, 90))
 
-        start_angle = index * 45 - 22.5 - 90
-
-        path = QPainterPath()
-        inner_start_x = cx + inner_r * math.cos(math.radians(start_angle))
-        inner_start_y = cy + inner_r * math.sin(math.radians(start_angle))
-        path.moveTo(inner_start_x, inner_start_y)
-
-        outer_start_x = cx + outer_r * math.cos(math.radians(start_angle))
-        outer_start_y = cy + outer_r * math.sin(math.radians(start_angle))
-        path.lineTo(outer_start_x, outer_start_y)
-
-        outer_rect = QRectF(cx - outer_r, cy - outer_r, outer_r * 2, outer_r * 2)
-        path.arcTo(outer_rect, -start_angle, -45)
+        path = slice_path(cx, cy, index, inner_r, outer_r)
 
-        end_angle = start_angle + 45
-        inner_end_x = cx + inner_r * math.cos(math.radians(end_angle))
-        inner_end_y = cy + inner_r * math.sin(math.radians(end_angle))
-        path.lineTo(inner_end_x, inner_end_y)
-
-        inner_rect = QRectF(cx - inner_r, cy - inner_r, inner_r * 2, inner_r * 2)
-        path.arcTo(inner_rect, -end_angle, 45)
-        path.closeSubpath()
-
-        p.setBrush(QBrush(QColor(*fill_rgba)))
-        p.setPen(QPen(QColor(*border_rgba), 1.5))
+        p.setBrush(cached_brush(fill_rgba))
+        p.setPen(cached_pen(border_rgba, 1.5))
         p.drawPath(path)
 
     def _draw_badge_shape(self, p, x, y, shape, params, angle_deg, size_extra=0):
@@ -1207,19 +1601,15 @@ class RadialMenu(QWidget):
             p.translate(x, y)
             p.rotate(angle_deg + 90)
             path = QPainterPath()
-            for i in range(6):
-                a = math.radians(i * 60 - 90)
-                hx = r * math.cos(a)
-                hy = r * math.sin(a)
-                if i == 0:
-                    path.moveTo(hx, hy)
-                else:
-                    path.lineTo(hx, hy)
+            (ux, uy), *rest = _HEXAGON_UNIT
+            path.moveTo(r * ux, r * uy)
+            for ux, uy in rest:
+                path.lineTo(r * ux, r * uy)
             path.closeSubpath()
             p.drawPath(path)
             p.restore()
 
-    def _draw_3d_icon(self, p, cx, cy, index):
+    def _draw_3d_icon(self, p, cx, cy, index, is_highlighted):
         """Draw an icon on the 3D radial image with per-theme badge shape."""
         params = RADIAL_PARAMS or {}
         icon_radius = params.get("icon_radius", ICON_ZONE_RADIUS)
@@ -1235,17 +1625,14 @@ class RadialMenu(QWidget):
         bg_shape = params.get("icon_bg_shape", "circle")
         border_w = params.get("icon_bg_border_width", 1.5)
 
-        is_highlighted = index == self.highlighted_slice
         action = ACTIONS[index]
 
         angle_deg = index * 45 - 90
-        icon_angle = math.radians(angle_deg)
-        icon_x = cx + icon_radius * math.cos(icon_angle)
-        icon_y = cy + icon_radius * math.sin(icon_angle)
+        icon_x, icon_y = icon_position(cx, cy, index, icon_radius)
 
         # Drop shadow (skip if alpha is 0)
         if shadow_alpha > 0:
-            p.setBrush(QBrush(QColor(0, 0, 0, shadow_alpha)))
+            p.setBrush(cached_brush((0, 0, 0, shadow_alpha)))
             p.setPen(Qt.PenStyle.NoPen)
             if bg_rgba:
                 self._draw_badge_shape(
@@ -1265,14 +1652,11 @@ class RadialMenu(QWidget):
         # Background badge
         if bg_rgba:
             if is_highlighted:
-                bg_color = QColor(
-                    bg_rgba[0], bg_rgba[1], bg_rgba[2], min(255, bg_rgba[3] + 40)
-                )
+                p.setBrush(cached_brush(bg_rgba, min(255, bg_rgba[3] + 40)))
             else:
-                bg_color = QColor(*bg_rgba)
-            p.setBrush(QBrush(bg_color))
+                p.setBrush(cached_brush(bg_rgba))
             if bg_border_rgba:
-                p.setPen(QPen(QColor(*bg_border_rgba), border_w))
+                p.setPen(cached_pen(bg_border_rgba, border_w))
             else:
                 p.setPen(Qt.PenStyle.NoPen)
             self._draw_badge_shape(p, icon_x, icon_y, bg_shape, params, angle_deg)
@@ -1280,7 +1664,7 @@ class RadialMenu(QWidget):
         # Hover glow outline (outside the badge)
         if is_highlighted:
             p.setBrush(Qt.BrushStyle.NoBrush)
-            p.setPen(QPen(QColor(*glow_rgba), 3 * scale))
+            p.setPen(cached_pen(glow_rgba, 3 * scale))
             if bg_rgba:
                 self._draw_badge_shape(
                     p, icon_x, icon_y, bg_shape, params, angle_deg, size_extra=4
@@ -1290,98 +1674,62 @@ class RadialMenu(QWidget):
 
         # Draw icon - brighten and scale up on hover for better feedback
         if is_highlighted:
-            icon_color = QColor(
+            icon_color = rgba_color(
                 min(255, icon_rgb[0] + 40),
                 min(255, icon_rgb[1] + 40),
                 min(255, icon_rgb[2] + 40),
             )
             hover_bold = bold * 1.12
         else:
-            icon_color = QColor(*icon_rgb)
+            icon_color = rgba_color(*icon_rgb)
             hover_bold = bold
         icon_size = 26 * 0.65 * scale
-        p.save()
-        p.translate(icon_x, icon_y)
-        p.scale(hover_bold, hover_bold)
-        self._draw_icon(p, 0, 0, action[4], icon_size, icon_color)
-        p.restore()
-
-    def _draw_slice(self, p, cx, cy, index):
-        is_highlighted = index == self.highlighted_slice
-        action = ACTIONS[index]
-
-        start_angle = index * 45 - 22.5 - 90
-        outer_r = MENU_RADIUS - 6
-        inner_r = CENTER_ZONE_RADIUS + 6
-
-        # Create slice path
-        path = QPainterPath()
-        # Start at inner arc
-        inner_start_x = cx + inner_r * math.cos(math.radians(start_angle))
-        inner_start_y = cy + inner_r * math.sin(math.radians(start_angle))
-        path.moveTo(inner_start_x, inner_start_y)
-
-        # Line to outer arc start
-        outer_start_x = cx + outer_r * math.cos(math.radians(start_angle))
-        outer_start_y = cy + outer_r * math.sin(math.radians(start_angle))
-        path.lineTo(outer_start_x, outer_start_y)
-
-        # Outer arc
-        outer_rect = QRectF(cx - outer_r, cy - outer_r, outer_r * 2, outer_r * 2)
-        path.arcTo(outer_rect, -start_angle, -45)
-
-        # Line to inner arc end
-        end_angle = start_angle + 45
-        inner_end_x = cx + inner_r * math.cos(math.radians(end_angle))
-        inner_end_y = cy + inner_r * math.sin(math.radians(end_angle))
-        path.lineTo(inner_end_x, inner_end_y)
-
-        # Inner arc back
-        inner_rect = QRectF(cx - inner_r, cy - inner_r, inner_r * 2, inner_r * 2)
-        path.arcTo(inner_rect, -end_angle, 45)
-
-        path.closeSubpath()
+        self._draw_cached_icon(
+            p, icon_x, icon_y, action.icon, icon_size, icon_color, hover_bold
+        )
 
+    def _set_slice_style(self, p, is_highlighted):
         # Fill slice - neutral hover (no color, just brightness)
         if is_highlighted:
-            fill = QColor(255, 255, 255)  # White overlay for hover
-            fill.setAlpha(45)
+            p.setBrush(cached_brush((255, 255, 255, 45)))  # White overlay for hover
         else:
-            fill = COLORS["surface0"]
-            fill.setAlpha(80)
-        p.setBrush(QBrush(fill))
+            p.setBrush(cached_brush(COLORS["surface0"], 80))
 
         # Slice border - subtle, neutral
         if is_highlighted:
-            stroke = QColor(255, 255, 255)
-            stroke.setAlpha(120)
+            p.setPen(cached_pen((255, 255, 255, 120), 1.5))
         else:
-            stroke = COLORS["surface2"]
-            stroke.setAlpha(60)
-        p.setPen(QPen(stroke, 1.5 if is_highlighted else 1))
+            p.setPen(cached_pen(COLORS["surface2"], 1, 60))
 
-        p.drawPath(path)
+    def _draw_slice(self, p, cx, cy, index, is_highlighted):
+        self._set_slice_style(p, is_highlighted)
+        p.drawPath(slice_path(cx, cy, index, CENTER_ZONE_RADIUS + 6, MENU_RADIUS - 6))
+        self._draw_slice_icon(p, cx, cy, index, is_highlighted)
+
+    def _draw_idle_slices(self, p, cx, cy):
+        """All eight slices in their idle state - one path, one draw call"""
+        self._set_slice_style(p, False)
+        p.drawPath(all_slices_path(cx, cy, CENTER_ZONE_RADIUS + 6, MENU_RADIUS - 6))
+        for i in range(8):
+            self._draw_slice_icon(p, cx, cy, i, False)
+
+    def _draw_slice_icon(self, p, cx, cy, index, is_highlighted):
+        action = ACTIONS[index]
 
         # Icon position (center of slice)
-        icon_angle = math.radians(index * 45 - 90)
-        icon_x = cx + ICON_ZONE_RADIUS * math.cos(icon_angle)
-        icon_y = cy + ICON_ZONE_RADIUS * math.sin(icon_angle)
+        icon_x, icon_y = icon_position(cx, cy, index, ICON_ZONE_RADIUS)
 
         # Icon circle background - larger, neutral colors
         icon_radius = 26
         if is_highlighted:
-            icon_bg = COLORS["surface2"]
-            icon_bg.setAlpha(255)
+            icon_bg = cached_brush(COLORS["surface2"], 255)
             # Add subtle glow ring
-            glow = QColor(255, 255, 255)
-            glow.setAlpha(40)
             p.setBrush(Qt.BrushStyle.NoBrush)
-            p.setPen(QPen(glow, 3))
+            p.setPen(cached_pen((255, 255, 255, 40), 3))
             p.drawEllipse(QPointF(icon_x, icon_y), icon_radius + 2, icon_radius + 2)
         else:
-            icon_bg = COLORS["surface1"]
-            icon_bg.setAlpha(230)
-        p.setBrush(QBrush(icon_bg))
+            icon_bg = cached_brush(COLORS["surface1"], 230)
+        p.setBrush(icon_bg)
         p.setPen(Qt.PenStyle.NoPen)
         p.drawEllipse(QPointF(icon_x, icon_y), icon_radius, icon_radius)
 
@@ -1390,7 +1738,59 @@ class RadialMenu(QWidget):
             icon_color = COLORS["text"]
         else:
             icon_color = COLORS["subtext1"]
-        self._draw_icon(p, icon_x, icon_y, action[4], icon_radius * 0.65, icon_color)
+        self._draw_cached_icon(
+            p, icon_x, icon_y, action.icon, icon_radius * 0.65, icon_color
+        )
+
+    def _icon_pixmap(self, icon_type, size, color, scale=1.0):
+        """Rasterize a vector icon once, centered in a transparent pixmap"""
+        dpr = self.devicePixelRatioF()
+        key = (icon_type, size, color.rgba(), scale, dpr)
+        pixmap = self._icon_cache.get(key)
+        if pixmap is None:
+            # Icons stay within `size` of their center, plus pen width
+            side = ceil((size + 4) * scale * 2 * dpr)
+            pixmap = QPixmap(side, side)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            half = side / dpr / 2
+            ip = QPainter(pixmap)
+            ip.setRenderHint(QPainter.RenderHint.Antialiasing)
+            ip.translate(half, half)
+            ip.scale(scale, scale)
+            self._draw_icon(ip, 0, 0, icon_type, size, color)
+            ip.end()
+            self._icon_cache[key] = pixmap
+        return pixmap
+
+    def _svg_icon_pixmap(self, name):
+        """AI icon SVG rendered once at subitem size, or None if unavailable"""
+        dpr = self.devicePixelRatioF()
+        key = ("svg", name, dpr)
+        try:
+            return self._icon_cache[key]
+        except KeyError:
+            pass
+
+        pixmap = None
+        renderer = get_ai_icon(name)
+        if renderer is not None:
+            icon_size = SUBITEM_RADIUS * 1.4  # Size of icon
+            side = ceil(icon_size * dpr)
+            pixmap = QPixmap(side, side)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            ip = QPainter(pixmap)
+            ip.setRenderHint(QPainter.RenderHint.Antialiasing)
+            renderer.render(ip, QRectF(0, 0, side / dpr, side / dpr))
+            ip.end()
+        self._icon_cache[key] = pixmap
+        return pixmap
+
+    def _draw_cached_icon(self, p, cx, cy, icon_type, size, color, scale=1.0):
+        pixmap = self._icon_pixmap(icon_type, size, color, scale)
+        half = pixmap.width() / pixmap.devicePixelRatio() / 2
+        p.drawPixmap(QPointF(cx - half, cy - half), pixmap)
 
     def _draw_icon(self, p, cx, cy, icon_type, size, color):
         # Thicker strokes for better visibility
@@ -1414,9 +1814,12 @@ class RadialMenu(QWidget):
             w, h = size * 0.65, size * 0.85
             p.setPen(QPen(color, 2))
             p.drawRoundedRect(QRectF(cx - w / 2, cy - h / 2, w, h), 2, 2)
+            lines = QPainterPath()
             for i in range(3):
                 y = cy - h / 4 + i * size * 0.22
-                p.drawLine(QPointF(cx - w / 3, y), QPointF(cx + w / 3, y))
+                lines.moveTo(cx - w / 3, y)
+                lines.lineTo(cx + w / 3, y)
+            p.drawPath(lines)
 
         elif icon_type == "lock":
             # Padlock
@@ -1433,29 +1836,27 @@ class RadialMenu(QWidget):
             # Gear icon - improved
             p.setPen(QPen(color, 2))
             p.drawEllipse(QPointF(cx, cy), size * 0.18, size * 0.18)
+            # All six teeth as one stroked path
+            inner, outer = size * 0.28, size * 0.45
+            teeth = QPainterPath()
             for i in range(6):
-                angle = i * math.pi / 3
-                inner, outer = size * 0.28, size * 0.45
-                x1 = cx + inner * math.cos(angle)
-                y1 = cy + inner * math.sin(angle)
-                x2 = cx + outer * math.cos(angle)
-                y2 = cy + outer * math.sin(angle)
-                p.setPen(QPen(color, 3))
-                p.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+                angle = i * pi / 3
+                teeth.moveTo(cx + inner * cos(angle), cy + inner * sin(angle))
+                teeth.lineTo(cx + outer * cos(angle), cy + outer * sin(angle))
+            p.setPen(QPen(color, 3))
+            p.drawPath(teeth)
 
         elif icon_type == "screenshot":
             # Camera/screenshot corners - bolder
             s, corner = size * 0.42, size * 0.18
             p.setPen(QPen(color, 2.5))
+            corners = QPainterPath()
             for dx, dy in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-                p.drawLine(
-                    QPointF(cx + dx * s, cy + dy * (s - corner)),
-                    QPointF(cx + dx * s, cy + dy * s),
-                )
-                p.drawLine(
-                    QPointF(cx + dx * s, cy + dy * s),
-                    QPointF(cx + dx * (s - corner), cy + dy * s),
-                )
+                corners.moveTo(cx + dx * s, cy + dy * (s - corner))
+                corners.lineTo(cx + dx * s, cy + dy * s)
+                corners.lineTo(cx + dx * (s - corner), cy + dy * s)
+            p.setBrush(Qt.BrushStyle.NoBrush)
+            p.drawPath(corners)
             # Center dot
             p.setBrush(QBrush(color))
             p.setPen(Qt.PenStyle.NoPen)
@@ -1634,112 +2035,121 @@ class RadialMenu(QWidget):
 
     def _draw_submenu(self, p, cx, cy):
         """Draw submenu items when active."""
-        submenu = ACTIONS[self.submenu_slice][5]
+        submenu = ACTION_SUBMENUS[self.submenu_slice]
         if not submenu:
             return
 
-        # Calculate parent slice angle
-        parent_angle = self.submenu_slice * 45 - 90
-
-        # Submenu items positioned in an arc beyond the main menu
-        SUBMENU_RADIUS = MENU_RADIUS + 45
-        SUBITEM_RADIUS = 24  # Size of each subitem circle
-
-        num_items = len(submenu)
-        spread = 18  # Degrees between items
-
-        for i, item in enumerate(submenu):
-            is_highlighted = i == self.highlighted_subitem
-
-            # Calculate position
-            offset = (i - (num_items - 1) / 2) * spread
-            item_angle = math.radians(parent_angle + offset)
-            item_x = cx + SUBMENU_RADIUS * math.cos(item_angle)
-            item_y = cy + SUBMENU_RADIUS * math.sin(item_angle)
-
-            # Shadow for subitem
-            shadow = QColor(0, 0, 0, 80)
-            p.setBrush(QBrush(shadow))
-            p.setPen(Qt.PenStyle.NoPen)
-            p.drawEllipse(
-                QPointF(item_x + 2, item_y + 3), SUBITEM_RADIUS, SUBITEM_RADIUS
-            )
-
-            # Background
-            if is_highlighted:
-                bg = COLORS["surface2"]
-                bg.setAlpha(255)
-                # Glow ring
-                glow = QColor(255, 255, 255, 60)
-                p.setBrush(Qt.BrushStyle.NoBrush)
-                p.setPen(QPen(glow, 3))
-                p.drawEllipse(
-                    QPointF(item_x, item_y), SUBITEM_RADIUS + 3, SUBITEM_RADIUS + 3
-                )
-            else:
-                bg = COLORS["surface1"]
-                bg.setAlpha(240)
+        # Shadows first, in one pass - items are spaced far enough apart
+        # that no shadow reaches a neighbouring item
+        p.setBrush(cached_brush((0, 0, 0, 80)))
+        p.setPen(Qt.PenStyle.NoPen)
+        for center in self._subitem_shadow_points:
+            p.drawEllipse(center, SUBITEM_RADIUS, SUBITEM_RADIUS)
 
-            p.setBrush(QBrush(bg))
-            border = (
-                COLORS["surface2"] if not is_highlighted else QColor(255, 255, 255, 150)
-            )
-            p.setPen(QPen(border, 1.5))
-            p.drawEllipse(QPointF(item_x, item_y), SUBITEM_RADIUS, SUBITEM_RADIUS)
+        # Resolve both item styles once per paint, not once per item
+        normal_bg = cached_brush(COLORS["surface1"], 240)
+        normal_border = cached_pen(COLORS["surface2"], 1.5)
+        hover_bg = cached_brush(COLORS["surface2"], 255)
+        hover_border = cached_pen((255, 255, 255, 150), 1.5)
 
+        # Submenu items positioned in an arc beyond the main menu
+        # (geometry is cached when the submenu opens). Backgrounds are
+        # batched by style: every idle disk under one brush/pen, then the
+        # (at most one) highlighted disk with its glow ring
+        highlighted = self.highlighted_subitem
+        p.setBrush(normal_bg)
+        p.setPen(normal_border)
+        for i, center in enumerate(self._subitem_points):
+            if i != highlighted:
+                p.drawEllipse(center, SUBITEM_RADIUS, SUBITEM_RADIUS)
+
+        if 0 <= highlighted < len(self._subitem_points):
+            center = self._subitem_points[highlighted]
+            p.setBrush(Qt.BrushStyle.NoBrush)
+            p.setPen(cached_pen((255, 255, 255, 60), 3))
+            p.drawEllipse(center, SUBITEM_RADIUS + 3, SUBITEM_RADIUS + 3)
+            p.setBrush(hover_bg)
+            p.setPen(hover_border)
+            p.drawEllipse(center, SUBITEM_RADIUS, SUBITEM_RADIUS)
+
+        # Icons last, after all backgrounds
+        for i, (item, center) in enumerate(zip(submenu, self._subitem_points)):
             # Icon - use SVG if available, fallback to drawn icon
-            icon_name = item[3]  # e.g., "claude", "chatgpt", etc.
-            if icon_name in AI_ICONS:
-                # Render SVG icon
-                icon_size = SUBITEM_RADIUS * 1.4  # Size of icon
-                icon_rect = QRectF(
-                    item_x - icon_size / 2, item_y - icon_size / 2, icon_size, icon_size
-                )
-                AI_ICONS[icon_name].render(p, icon_rect)
+            icon_name = item.icon  # e.g., "claude", "chatgpt", etc.
+            svg_pixmap = self._svg_icon_pixmap(icon_name)
+            if svg_pixmap is not None:
+                # Pre-rasterized SVG icon at a whole-pixel position
+                p.drawPixmap(self._subitem_icon_points[i], svg_pixmap)
             else:
                 # Fallback to drawn icon
-                icon_color = COLORS["text"] if is_highlighted else COLORS["subtext1"]
-                self._draw_icon(
+                item_x = center.x()
+                item_y = center.y()
+                icon_color = COLORS["text"] if i == highlighted else COLORS["subtext1"]
+                self._draw_cached_icon(
                     p, item_x, item_y, icon_name, SUBITEM_RADIUS * 0.7, icon_color
                 )
 
-    def _draw_center(self, p, cx, cy):
+    def _draw_center_disk(self, p, cx, cy):
+        """Draw the center zone disk - returns its border width"""
         params = RADIAL_PARAMS or {}
         center_bg = params.get("center_bg")
         center_radius = self._get_center_radius()
 
         if center_bg:
             # 3D themed center zone
-            p.setBrush(QBrush(QColor(*center_bg)))
+            p.setBrush(cached_brush(center_bg))
             border_rgba = params.get("center_border", (150, 150, 150, 150))
             border_w = params.get("center_border_width", 2.0)
-            p.setPen(QPen(QColor(*border_rgba), border_w))
-            p.drawEllipse(QPointF(cx, cy), center_radius, center_radius)
-            text_rgb = params.get("center_text_color", (200, 200, 200))
-            text_color = QColor(*text_rgb)
+            p.setPen(cached_pen(border_rgba, border_w))
         else:
             # Original vector mode center
-            base = QColor(COLORS["base"])
-            base.setAlpha(247)
-            p.setBrush(QBrush(base))
-            border = QColor(COLORS["surface2"])
-            border.setAlpha(150)
-            p.setPen(QPen(border, 2))
-            p.drawEllipse(QPointF(cx, cy), center_radius, center_radius)
-            text_color = QColor(COLORS["subtext1"])
+            border_w = 2
+            p.setBrush(cached_brush(COLORS["base"], 247))
+            p.setPen(cached_pen(COLORS["surface2"], border_w, 150))
+        p.drawEllipse(QPointF(cx, cy), center_radius, center_radius)
+        return border_w
+
+    def _draw_center_label(self, p, cx, cy):
+        params = RADIAL_PARAMS or {}
+        center_bg = params.get("center_bg")
+        center_radius = self._get_center_radius()
+
+        if self._center_text_pen is None:
+            if center_bg:
+                text_rgb = params.get("center_text_color", (200, 200, 200))
+                self._center_text_pen = QPen(rgba_color(*text_rgb))
+            else:
+                self._center_text_pen = QPen(COLORS["subtext1"])
 
         # Label text - show submenu item name if hovering one
         if self.submenu_active and self.highlighted_subitem >= 0:
-            submenu = ACTIONS[self.submenu_slice][5]
-            text = submenu[self.highlighted_subitem][0] if submenu else "AI"
+            submenu = ACTION_SUBMENUS[self.submenu_slice]
+            text = submenu[self.highlighted_subitem].label if submenu else "AI"
         elif self.highlighted_slice >= 0:
-            text = ACTIONS[self.highlighted_slice][0]
+            text = ACTIONS[self.highlighted_slice].label
         else:
             text = _("Drag")
         base_font_size = int(params.get("center_font_size", 11))
         min_font_size = int(params.get("center_min_font_size", 7))
         font_bold = bool(params.get("center_font_bold", False))
 
+        key = (text, cx, cy, center_radius, base_font_size, min_font_size, font_bold)
+        layout = self._center_layout_cache.get(key)
+        if layout is None:
+            layout = self._layout_center_text(
+                text, cx, cy, center_radius, base_font_size, min_font_size, font_bold
+            )
+            self._center_layout_cache[key] = layout
+        text_rect, font, text_flags, text = layout
+
+        p.setFont(font)
+        p.setPen(self._center_text_pen)
+        p.drawText(text_rect, text_flags, text)
+
+    def _layout_center_text(
+        self, text, cx, cy, center_radius, base_font_size, min_font_size, font_bold
+    ):
+        """Fit label into the center zone - returns (rect, font, flags, text)"""
         text = self._wrap_center_text(text)
 
         text_width = center_radius * 1.7
@@ -1766,18 +2176,14 @@ class RadialMenu(QWidget):
             metrics = QFontMetrics(font)
             bounds = metrics.boundingRect(text_rect.toRect(), int(text_flags), text)
 
-        p.setFont(font)
-        p.setPen(QPen(text_color))
-
         if bounds.width() > text_rect.width() or bounds.height() > text_rect.height():
             elided = metrics.elidedText(
                 text.replace("\n", " "),
                 Qt.TextElideMode.ElideRight,
                 int(text_rect.width()),
             )
-            p.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, elided)
-        else:
-            p.drawText(text_rect, text_flags, text)
+            return text_rect, font, Qt.AlignmentFlag.AlignCenter, elided
+        return text_rect, font, text_flags, text
 
     def _wrap_center_text(self, text):
         if not text or "\n" in text:
@@ -1803,6 +2209,24 @@ class RadialMenu(QWidget):
         return " ".join(words[:split_index]) + "\n" + " ".join(words[split_index:])
 
 
+_TRAY_MENU_QSS = """
+    QMenu {
+        background-color: #1e1e2e;
+        color: #cdd6f4;
+        border: 1px solid #45475a;
+        border-radius: 8px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 8px 24px;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background-color: #45475a;
+    }
+"""
+
+
 def create_tray_icon(app, radial_menu):
     """Create system tray icon with menu"""
     # Prefer icon theme lookup (works with installed desktop icon cache)
@@ -1840,22 +2264,7 @@ def create_tray_icon(app, radial_menu):
 
     # Create context menu
     menu = QMenu()
-    menu.setStyleSheet("""
-        QMenu {
-            background-color: #1e1e2e;
-            color: #cdd6f4;
-            border: 1px solid #45475a;
-            border-radius: 8px;
-            padding: 4px;
-        }
-        QMenu::item {
-            padding: 8px 24px;
-            border-radius: 4px;
-        }
-        QMenu::item:selected {
-            background-color: #45475a;
-        }
-    """)
+    menu.setStyleSheet(_TRAY_MENU_QSS)
 
     # Settings action
     settings_action = menu.addAction(_("Settings"))
@@ -1865,14 +2274,9 @@ def create_tray_icon(app, radial_menu):
 
     # Exit action - also closes settings dashboard if open
     def exit_application():
-        import subprocess
-        import os
-
-        # Kill settings dashboard if running
-        uid = str(os.getuid())
-        subprocess.run(
-            ["pkill", "-u", uid, "-f", "settings_dashboard.py"], capture_output=True
-        )
+        # Ask settings dashboard to quit if running - nothing to do otherwise
+        if _settings_running():
+            _call_settings_app("org.gtk.Actions", "Activate", "quit", [], {})
         app.quit()
 
     exit_action = menu.addAction(_("Exit"))
@@ -1885,18 +2289,39 @@ def create_tray_icon(app, radial_menu):
 
 
 if __name__ == "__main__":
+    # JUHRADIAL_LOG=info|debug raises verbosity; JUHRADIAL_DEBUG is kept as
+    # an alias for debug. Default is WARNING so a normal session stays quiet.
+    _log_level = os.environ.get("JUHRADIAL_LOG", "").strip().upper()
+    if os.environ.get("JUHRADIAL_DEBUG"):
+        _log_level = "DEBUG"
+    logging.basicConfig(
+        level=getattr(logging, _log_level, None)
+        if _log_level in ("DEBUG", "INFO", "WARNING", "ERROR")
+        else logging.WARNING,
+        format="%(name)s: %(message)s",
+    )
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     app.setApplicationName("JuhRadial MX")
     app.setDesktopFileName("juhradial-mx")  # Match installed desktop entry
 
-    # Load AI submenu icons and 3D radial image (requires QApplication)
-    load_ai_icons()
+    # Owning the well-known name makes this the single overlay instance; a
+    # second overlay that loses the race must not keep running alongside it
+    if not QDBusConnection.sessionBus().registerService(OVERLAY_BUS_NAME):
+        logger.error(
+            "[DBUS] Could not register %s - overlay already running, exiting",
+            OVERLAY_BUS_NAME,
+        )
+        sys.exit(1)
+
+    # Load 3D radial image (requires QApplication)
+    # AI submenu icons are loaded on first use by get_ai_icon()
     load_radial_image()
 
     w = RadialMenu()
     app.tray = create_tray_icon(app, w)  # Store reference on app to prevent GC
 
-    print("Starting overlay event loop")
-    print("System tray icon active - right-click for menu")
+    logger.info("Starting overlay event loop")
+    logger.info("System tray icon active - right-click for menu")
     sys.exit(app.exec())
@@ -0,0 +1,71 @@
+"""
+JuhRadial MX - Radial Menu Geometry
+
+Menu dimensions and the pure math behind slice hit-testing and item
+placement. Kept free of Qt so it can be imported (and tested) headless.
+
+SPDX-License-Identifier: GPL-3.0
+"""
+
+from functools import lru_cache
+from math import cos, pi, radians, sin, tan
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+MENU_RADIUS = 150
+SHADOW_OFFSET = 12
+CENTER_ZONE_RADIUS = 45
+ICON_ZONE_RADIUS = 100
+SUBMENU_EXTEND = 80  # Extra space for submenu items beyond main menu
+WINDOW_SIZE = (MENU_RADIUS + SHADOW_OFFSET + SUBMENU_EXTEND) * 2
+_OCTANT_TAN = tan(pi / 8)  # Slice edges lie 22.5 degrees either side of an axis
+
+# Hit-testing compares squared distances, so no sqrt per mouse event
+SUBMENU_RADIUS = MENU_RADIUS + 45  # Distance from center to submenu items
+SUBMENU_SPREAD = 18  # Degrees between submenu items
+SUBITEM_RADIUS = 24  # Drawn size of each subitem circle
+SUBITEM_HIT_RADIUS = 32  # Hover radius of each subitem circle
+MENU_RADIUS_SQ = MENU_RADIUS * MENU_RADIUS
+SUBMENU_REACH_SQ = (MENU_RADIUS + 60) ** 2  # Extended range for submenu
+SUBITEM_HIT_SQ = SUBITEM_HIT_RADIUS * SUBITEM_HIT_RADIUS
+# Every subitem sits on the SUBMENU_RADIUS arc, so hits fall inside this ring
+SUBITEM_RING_MIN_SQ = (SUBMENU_RADIUS - SUBITEM_HIT_RADIUS) ** 2
+SUBITEM_RING_MAX_SQ = (SUBMENU_RADIUS + SUBITEM_HIT_RADIUS) ** 2
+
+
+def slice_index(dx, dy):
+    """Slice under an offset from center: 0 = top, counting clockwise.
+
+    Picks the octant from signs and an |dx| vs |dy| ratio test instead of
+    atan2, since this runs on every cursor motion event.
+    """
+    ax = abs(dx)
+    ay = abs(dy)
+    if ax <= _OCTANT_TAN * ay:
+        return 0 if dy < 0 else 4
+    if ay <= _OCTANT_TAN * ax:
+        return 2 if dx > 0 else 6
+    if dx > 0:
+        return 1 if dy < 0 else 3
+    return 7 if dy < 0 else 5
+
+
+@lru_cache(maxsize=64)
+def submenu_offsets(index, num_items):
+    """Offsets from center of a slice's submenu items, fanned around the slice"""
+    # Work in radians directly: parent direction plus a fixed step per item
+    parent = (index * 45 - 90) * (pi / 180)
+    step = SUBMENU_SPREAD * (pi / 180)
+    first = parent - (num_items - 1) / 2 * step
+    return tuple(
+        (SUBMENU_RADIUS * cos(first + i * step), SUBMENU_RADIUS * sin(first + i * step))
+        for i in range(num_items)
+    )
+
+
+@lru_cache(maxsize=64)
+def icon_position(cx, cy, index, radius):
+    """Center of a slice's icon at the given distance from the menu center"""
+    icon_angle = radians(index * 45 - 90)
+    return cx + radius * cos(icon_angle), cy + radius * sin(icon_angle)
@@ -8,8 +8,12 @@ Provides atomic saves, D-Bus notification, and device detection.
 SPDX-License-Identifier: GPL-3.0
 """
 
+import copy
 import os
 import json
+import re
+import shlex
+import subprocess
 from pathlib import Path
 
 import gi
@@ -20,6 +24,7 @@ gi.require_version("Adw", "1")
 from gi.repository import Gtk, Gio, GLib
 
 from i18n import _
+from themes import CONFIG_DIR, CONFIG_FILE
 
 
 # =============================================================================
@@ -28,8 +33,8 @@ from i18n import _
 class ConfigManager:
     """Manages JuhRadial MX configuration - shares config with daemon"""
 
-    CONFIG_DIR = Path.home() / ".config" / "juhradial"
-    CONFIG_FILE = CONFIG_DIR / "config.json"
+    CONFIG_DIR = CONFIG_DIR
+    CONFIG_FILE = CONFIG_FILE
 
     DEFAULT_CONFIG = {
         "haptics": {
@@ -127,9 +132,42 @@ class ConfigManager:
         },
     }
 
+    # Coalesce bursts of saves (slider drags, dropdown cascades) into one
+    # disk write and one daemon reload
+    SAVE_DELAY_MS = 150
+
+    # One encoder for every save; json.dump builds a fresh one per call
+    _ENCODER = json.JSONEncoder(indent=2)
+
     def __init__(self):
+        self._flat = {}
         self.config = self._load()
         self._toast_callback = None
+        self._save_source_id = None
+        self._pending_full = False  # Whole config awaits writing
+        self._pending_keys = set()  # Key paths awaiting writing on their own
+        self._pending_toast = False
+
+    @property
+    def config(self) -> dict:
+        return self._config
+
+    @config.setter
+    def config(self, value: dict):
+        self._config = value
+        self._rebuild_flat()
+
+    def _rebuild_flat(self):
+        """Index every key path so get() is a single dict lookup"""
+        self._flat = {}
+        self._index_flat((), self._config)
+
+    def _index_flat(self, prefix: tuple, node: dict):
+        for key, value in node.items():
+            path = prefix + (key,)
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._index_flat(path, value)
 
     def set_toast_callback(self, callback):
         """Set callback for showing toast notifications"""
@@ -143,23 +181,39 @@ class ConfigManager:
     def _load(self) -> dict:
         """Load config from file or return defaults"""
         try:
-            if self.CONFIG_FILE.exists():
-                with open(self.CONFIG_FILE, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                return self._merge_defaults(loaded)
+            with open(self.CONFIG_FILE, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+            # Merge with defaults to ensure all keys exist
+            return self._merge_defaults(loaded)
+        except FileNotFoundError:
+            pass  # First run - use defaults
         except Exception as e:
             print(f"Error loading config: {e}")
-        return self.DEFAULT_CONFIG.copy()
+        return copy.deepcopy(self.DEFAULT_CONFIG)
+
+    def _read_raw(self) -> dict:
+        """Read config file as stored, without defaults (empty if missing)
+
+        Raises on unreadable or malformed files.
+        """
+        try:
+            with open(self.CONFIG_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        if not isinstance(data, dict):
+            raise ValueError("config root is not an object")
+        return data
 
     def reload(self):
         """Reload config from disk - useful when settings window reopens"""
+        self.flush()
         self.config = self._load()
         return self.config
 
     def _merge_defaults(self, loaded: dict) -> dict:
         """Deep merge loaded config with defaults"""
-        result = json.loads(json.dumps(self.DEFAULT_CONFIG))  # Deep copy
+        result = copy.deepcopy(self.DEFAULT_CONFIG)
         self._deep_update(result, loaded)
         return result
 
@@ -172,45 +226,92 @@ class ConfigManager:
                 base[key] = value
 
     def save(self, show_toast=True):
-        """Save config to file atomically and notify daemon"""
+        """Schedule saving the whole config (debounced) and notifying the daemon
+
+        Saves requested within SAVE_DELAY_MS are written once. Use flush()
+        when the file must be on disk before continuing.
+        """
+        self._pending_full = True
+        self._pending_toast = self._pending_toast or show_toast
+        self._schedule_save()
+
+    def save_key(self, *keys):
+        """Schedule saving only the value at a key path (debounced)
+
+        The file on disk keeps every other value, so unapplied edits made
+        elsewhere in the in-memory config are not written along with it.
+        """
+        self._pending_keys.add(keys)
+        self._schedule_save()
+
+    def flush(self):
+        """Write any pending save now. Returns False if the write failed."""
+        if self._save_source_id is not None:
+            GLib.source_remove(self._save_source_id)
+            self._save_source_id = None
+            return self._write_pending()
+        return True
+
+    def _schedule_save(self):
+        if self._save_source_id is None:
+            self._save_source_id = GLib.timeout_add(
+                self.SAVE_DELAY_MS, self._on_save_timeout
+            )
+
+    def _on_save_timeout(self):
+        self._save_source_id = None
+        self._write_pending()
+        return GLib.SOURCE_REMOVE
+
+    def _write_pending(self):
+        """Write config to file atomically and notify daemon
+
+        Returns False if nothing could be written.
+        """
+        show_toast = self._pending_toast
+        pending_full = self._pending_full
+        pending_keys = self._pending_keys
+        self._pending_full = False
+        self._pending_keys = set()
+        self._pending_toast = False
+
+        if pending_full:
+            data = self._config
+        else:
+            # Raw file contents (no defaults merged in) with just the
+            # pending values replaced
+            try:
+                data = self._read_raw()
+                for keys in pending_keys:
+                    target = data
+                    for key in keys[:-1]:
+                        target = target.setdefault(key, {})
+                    target[keys[-1]] = self.get(*keys)
+            except Exception as e:
+                # Never replace a file we could not read
+                print(f"Error reading config, not saved: {e}")
+                self._show_toast(_("Error saving settings: {}").format(e))
+                return False
+
         try:
             self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             # Atomic write: write to temp file, then rename (atomic on POSIX)
             temp_path = self.CONFIG_FILE.with_suffix(".json.tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2)
+            temp_path.write_bytes(self._ENCODER.encode(data).encode("utf-8"))
             # Atomic rename - replaces old file safely
             os.replace(temp_path, self.CONFIG_FILE)
-            # Notify daemon to reload config
-            self._notify_daemon()
+            # Notify daemon to reload config (non-blocking)
+            call_daemon("ReloadConfig")
             if show_toast:
                 self._show_toast(_("Settings saved"))
+            return True
         except Exception as e:
             print(f"Error saving config: {e}")
             self._show_toast(_("Error saving settings: {}").format(e))
-
-    def _notify_daemon(self):
-        """Notify daemon to reload config via D-Bus"""
-        try:
-            bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-            proxy = Gio.DBusProxy.new_sync(
-                bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                "org.kde.juhradialmx",
-                "/org/kde/juhradialmx/Daemon",
-                "org.kde.juhradialmx.Daemon",
-                None,
-            )
-            proxy.call_sync("ReloadConfig", None, Gio.DBusCallFlags.NONE, 500, None)
-        except GLib.Error:
-            pass  # Daemon may not be running
+            return False
 
     def apply_to_device(self):
         """Apply settings to device via logiops (requires sudo)"""
-        import subprocess
-        import shlex
-
         script_path = Path(__file__).parent.parent / "scripts" / "apply-settings.sh"
         if script_path.exists() and not script_path.is_symlink():
             # Run in konsole for sudo password prompt
@@ -228,13 +329,7 @@ class ConfigManager:
 
     def get(self, *keys, default=None):
         """Get nested config value"""
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat.get(keys, default)
 
     def set(self, *keys_and_value, auto_save=False):
         """Set nested config value and optionally save
@@ -246,12 +341,20 @@ class ConfigManager:
         if len(keys_and_value) < 2:
             return
         *keys, value = keys_and_value
-        target = self.config
+        target = self._config
+        created = False
         for key in keys[:-1]:
             if key not in target:
                 target[key] = {}
+                created = True
             target = target[key]
+        previous = target.get(keys[-1])
         target[keys[-1]] = value
+        if created or isinstance(value, dict) or isinstance(previous, dict):
+            # Subtree shape changed - re-index everything below it
+            self._rebuild_flat()
+        else:
+            self._flat[tuple(keys)] = value
         if auto_save:
             self.save()
 
@@ -263,6 +366,52 @@ config = ConfigManager()
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
+_daemon_proxy = None
+
+
+def get_daemon_proxy():
+    """Shared daemon proxy, created once - no introspection or property loading"""
+    global _daemon_proxy
+    if _daemon_proxy is None:
+        try:
+            bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+            _daemon_proxy = Gio.DBusProxy.new_sync(
+                bus,
+                Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES
+                | Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS
+                | Gio.DBusProxyFlags.DO_NOT_AUTO_START,
+                None,
+                "org.kde.juhradialmx",
+                "/org/kde/juhradialmx/Daemon",
+                "org.kde.juhradialmx.Daemon",
+                None,
+            )
+        except GLib.Error:
+            return None
+    return _daemon_proxy
+
+
+def call_daemon(method, parameters=None, timeout_ms=500):
+    """Fire-and-forget daemon method call - never blocks the UI thread"""
+    proxy = get_daemon_proxy()
+    if proxy is not None:
+        proxy.call(
+            method,
+            parameters,
+            Gio.DBusCallFlags.NO_AUTO_START,
+            timeout_ms,
+            None,
+            _on_daemon_call_done,
+        )
+
+
+def _on_daemon_call_done(proxy, result):
+    try:
+        proxy.call_finish(result)
+    except GLib.Error:
+        pass  # Daemon may not be running
+
+
 def disable_scroll_on_scale(scale):
     """Disable scroll wheel on Gtk.Scale to prevent accidental value changes
 
@@ -285,10 +434,6 @@ def disable_scroll_on_scale(scale):
 
 def detect_logitech_mouse():
     """Detect connected Logitech mouse name"""
-    import subprocess
-    import shutil
-    from pathlib import Path
-
     # Logitech vendor ID
     LOGITECH_VENDOR = "046d"
 
@@ -323,8 +468,6 @@ def detect_logitech_mouse():
             try:
                 with open(logid_cfg, "r", encoding="utf-8") as f:
                     content = f.read()
-                    import re
-
                     match = re.search(r'name:\s*"([^"]+)"', content)
                     if match:
                         return match.group(1)
@@ -205,10 +205,19 @@ _BASE_RADIAL_ACTIONS = [
 
 
 MOUSE_BUTTONS = {}
+# Translated button names in MOUSE_BUTTONS order, rebuilt with it
+MOUSE_BUTTON_NAMES = []
 NAV_ITEMS = []
 DEFAULT_BUTTON_ACTIONS = {}
 BUTTON_ACTIONS = []
 RADIAL_ACTIONS = []
+# Reverse indexes into RADIAL_ACTIONS (first match wins), rebuilt with it
+RADIAL_ACTIONS_BY_ID = {}
+_RADIAL_INDEX_BY_NAME = {}
+# Built in reverse so the first occurrence of a duplicate name wins
+_BASE_RADIAL_INDEX_BY_NAME = {
+    action[1]: idx for idx, action in reversed(list(enumerate(_BASE_RADIAL_ACTIONS)))
+}
 _RADIAL_LABEL_ALIAS_TO_ID = {
     "Play/Pause": "play_pause",
     "New Note": "new_note",
@@ -236,6 +245,7 @@ def refresh_translations(_=lambda x: x):
             "name": _(info["name"]),
             "action": action_label,
         }
+    MOUSE_BUTTON_NAMES[:] = [info["name"] for info in MOUSE_BUTTONS.values()]
 
     NAV_ITEMS[:] = [
         (item_id, _(label), icon) for item_id, label, icon in _BASE_NAV_ITEMS
@@ -254,41 +264,32 @@ def refresh_translations(_=lambda x: x):
         for action_id, label, icon, action_type, command, color in _BASE_RADIAL_ACTIONS
     ]
 
+    RADIAL_ACTIONS_BY_ID.clear()
+    _RADIAL_INDEX_BY_NAME.clear()
+    for idx, (action_id, name, _, _, _, _) in enumerate(RADIAL_ACTIONS):
+        RADIAL_ACTIONS_BY_ID.setdefault(action_id, idx)
+        _RADIAL_INDEX_BY_NAME.setdefault(name, idx)
+
 
 def find_radial_action_index(label):
     alias_action_id = _RADIAL_LABEL_ALIAS_TO_ID.get(label)
-    if alias_action_id:
-        for idx, (action_id, _, _, _, _, _) in enumerate(RADIAL_ACTIONS):
-            if action_id == alias_action_id:
-                return idx
-    for idx, (_, name, _, _, _, _) in enumerate(RADIAL_ACTIONS):
-        if name == label:
-            return idx
-    for idx, (_, name, _, _, _, _) in enumerate(_BASE_RADIAL_ACTIONS):
-        if name == label:
-            return idx
-    return -1
+    if alias_action_id in RADIAL_ACTIONS_BY_ID:
+        return RADIAL_ACTIONS_BY_ID[alias_action_id]
+    if label in _RADIAL_INDEX_BY_NAME:
+        return _RADIAL_INDEX_BY_NAME[label]
+    return _BASE_RADIAL_INDEX_BY_NAME.get(label, -1)
 
 
 def translate_radial_label(label, action_id=None):
-    if action_id:
-        for rid, name, _, _, _, _ in RADIAL_ACTIONS:
-            if rid == action_id:
-                return name
+    if action_id and action_id in RADIAL_ACTIONS_BY_ID:
+        return RADIAL_ACTIONS[RADIAL_ACTIONS_BY_ID[action_id]][1]
 
     alias_action_id = _RADIAL_LABEL_ALIAS_TO_ID.get(label)
-    if alias_action_id:
-        for rid, name, _, _, _, _ in RADIAL_ACTIONS:
-            if rid == alias_action_id:
-                return name
-
-    for idx, (_, base_name, _, _, _, _) in enumerate(_BASE_RADIAL_ACTIONS):
-        if base_name == label:
-            return RADIAL_ACTIONS[idx][1]
+    if alias_action_id in RADIAL_ACTIONS_BY_ID:
+        return RADIAL_ACTIONS[RADIAL_ACTIONS_BY_ID[alias_action_id]][1]
 
-    for _, name, _, _, _, _ in RADIAL_ACTIONS:
-        if name == label:
-            return name
+    if label in _BASE_RADIAL_INDEX_BY_NAME:
+        return RADIAL_ACTIONS[_BASE_RADIAL_INDEX_BY_NAME[label]][1]
 
     return label
 
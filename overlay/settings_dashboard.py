@@ -24,7 +24,7 @@ from i18n import _
 from settings_config import config, get_device_name
 from settings_theme import (
     COLORS,
-    CSS,
+    generate_css,
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     WINDOW_MIN_WIDTH,
@@ -650,16 +650,22 @@ class SettingsApp(Adw.Application):
     def do_startup(self):
         Adw.Application.do_startup(self)
 
-        # Load CSS
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(CSS.encode())
+        # Load CSS - generated here rather than at import, and kept so a
+        # theme change can reload this provider instead of stacking new ones
+        self.css_provider = Gtk.CssProvider()
+        self.css_provider.load_from_data(generate_css().encode())
 
         Gtk.StyleContext.add_provider_for_display(
             Gdk.Display.get_default(),
-            css_provider,
+            self.css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
         )
 
+        # Exported over org.gtk.Actions so the overlay can close us on exit
+        quit_action = Gio.SimpleAction.new("quit", None)
+        quit_action.connect("activate", lambda *_args: self.quit())
+        self.add_action(quit_action)
+
     def do_activate(self):
         # Single-instance logic: check if window already exists
         windows = self.get_windows()
@@ -678,6 +684,8 @@ class SettingsApp(Adw.Application):
         for window in self.get_windows():
             if hasattr(window, "_on_close_request"):
                 window._on_close_request(window)
+        # Write any save still waiting out its debounce
+        config.flush()
         Adw.Application.do_shutdown(self)
         print("Settings application shutdown complete")
 
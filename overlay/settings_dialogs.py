@@ -9,6 +9,9 @@ SPDX-License-Identifier: GPL-3.0
 """
 
 import json
+import re
+import subprocess
+import threading
 from pathlib import Path
 
 import gi
@@ -16,7 +19,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Gtk, GLib, Gio, Adw, Pango
+from gi.repository import Gtk, GLib, Adw, Pango
 
 from i18n import _
 from settings_config import ConfigManager, config
@@ -108,68 +111,83 @@ class ButtonConfigDialog(Adw.Window):
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_vexpand(True)
 
-        self.list_box = Gtk.ListBox()
-        self.list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.list_box.add_css_class("boxed-list")
-        self.list_box.set_margin_start(16)
-        self.list_box.set_margin_end(16)
-        self.list_box.set_margin_top(16)
-        self.list_box.set_margin_bottom(16)
+        # Virtualized list: row widgets exist only for visible actions
+        self._actions = list(BUTTON_ACTIONS)
+        self._action_names = [name for _action_id, name in self._actions]
+        self.selection = Gtk.SingleSelection.new(
+            Gtk.StringList.new(self._action_names)
+        )
+        self.selection.set_autoselect(False)
+        self.selection.set_can_unselect(True)
 
         # Find current action
         current_action = button_info.get("action", "")
+        if current_action in self._action_names:
+            index = self._action_names.index(current_action)
+            self.selection.set_selected(index)
+            self.selected_action = self._actions[index]
+        else:
+            self.selection.set_selected(Gtk.INVALID_LIST_POSITION)
 
-        for action_id, action_name in BUTTON_ACTIONS:
-            row = Adw.ActionRow()
-            row.set_title(action_name)
-            row.set_activatable(True)
-            row.action_id = action_id
-            row.action_name = action_name
-
-            # Radio-style indicator
-            radio = Gtk.CheckButton()
-            radio.set_active(action_name == current_action)
-            radio.set_sensitive(False)  # Visual only
-            row.add_prefix(radio)
-            row.radio = radio
-
-            if action_name == current_action:
-                self.selected_action = (action_id, action_name)
-                self.list_box.select_row(row)
-
-            self.list_box.append(row)
-
-        self.list_box.connect("row-selected", self._on_row_selected)
-        scrolled.set_child(self.list_box)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_action_item_setup)
+        factory.connect("bind", self._on_action_item_bind)
+
+        self.list_view = Gtk.ListView.new(self.selection, factory)
+        self.list_view.add_css_class("card")
+        self.list_view.set_margin_start(16)
+        self.list_view.set_margin_end(16)
+        self.list_view.set_margin_top(16)
+        self.list_view.set_margin_bottom(16)
+
+        self.selection.connect("notify::selected", self._on_selection_changed)
+        scrolled.set_child(self.list_view)
         content.append(scrolled)
 
         self.set_content(content)
 
-    def _on_row_selected(self, list_box, row):
-        if row is None:
-            return
+    def _on_action_item_setup(self, factory, list_item):
+        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        row.set_margin_start(12)
+        row.set_margin_end(12)
+        row.set_margin_top(12)
+        row.set_margin_bottom(12)
+
+        # Radio-style indicator
+        radio = Gtk.CheckButton()
+        radio.set_sensitive(False)  # Visual only
+        row.append(radio)
+        row.radio = radio
+
+        title = Gtk.Label()
+        title.set_halign(Gtk.Align.START)
+        row.append(title)
+        row.title = title
+
+        list_item.set_child(row)
+        list_item.connect(
+            "notify::selected", lambda item, _pspec: radio.set_active(item.get_selected())
+        )
 
-        # Update radio buttons visually
-        child = list_box.get_first_child()
-        while child:
-            if hasattr(child, "radio"):
-                child.radio.set_active(child == row)
-            child = child.get_next_sibling()
+    def _on_action_item_bind(self, factory, list_item):
+        row = list_item.get_child()
+        row.title.set_label(list_item.get_item().get_string())
+        row.radio.set_active(list_item.get_selected())
 
-        if hasattr(row, "action_id"):
-            self.selected_action = (row.action_id, row.action_name)
+    def _on_selection_changed(self, selection, _pspec):
+        index = selection.get_selected()
+        if index != Gtk.INVALID_LIST_POSITION:
+            self.selected_action = self._actions[index]
 
     def _on_restore_default(self, button):
         """Restore button to default action"""
         default_action = DEFAULT_BUTTON_ACTIONS.get(self.button_id, "Middle Click")
 
         # Find and select the default action row
-        child = self.list_box.get_first_child()
-        while child:
-            if hasattr(child, "action_name") and child.action_name == default_action:
-                self.list_box.select_row(child)
-                break
-            child = child.get_next_sibling()
+        if default_action in self._action_names:
+            index = self._action_names.index(default_action)
+            self.selection.set_selected(index)
+            self.list_view.scroll_to(index, Gtk.ListScrollFlags.NONE, None)
 
     def _on_save(self, button):
         if self.selected_action:
@@ -179,10 +197,8 @@ class ButtonConfigDialog(Adw.Window):
             if self.button_id in MOUSE_BUTTONS:
                 MOUSE_BUTTONS[self.button_id]["action"] = action_name
 
-            # Save to config
-            buttons_config = config.get("buttons", default={})
-            buttons_config[self.button_id] = action_id
-            config.set("buttons", buttons_config)
+            # Save to config (in memory, one leaf - persisted by Apply)
+            config.set("buttons", self.button_id, action_id)
 
             print(f"Button {self.button_id} configured to: {action_name}")
 
@@ -299,22 +315,11 @@ class RadialMenuConfigDialog(Adw.Window):
         self.set_content(main_box)
 
     def _load_profile(self):
-        """Load the current radial menu from config.json"""
-        config_path = Path.home() / ".config" / "juhradial" / "config.json"
-        try:
-            if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
-                    # Return the radial_menu section
-                    return config_data.get("radial_menu", {})
-        except Exception as e:
-            print(f"Failed to load config: {e}")
-        return {}
+        """Current radial menu section (served from the shared ConfigManager)"""
+        return config.get("radial_menu", default={})
 
     def _on_save(self, _):
         """Save the radial menu configuration to config.json"""
-        config_path = Path.home() / ".config" / "juhradial" / "config.json"
-
         # Build new slices config in the format the overlay expects
         slices = []
         for i in range(8):
@@ -335,42 +340,14 @@ class RadialMenuConfigDialog(Adw.Window):
                     }
                 )
 
-        # Load existing config and update radial_menu.slices
-        try:
-            config_data = {}
-            if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
-
-            if "radial_menu" not in config_data:
-                config_data["radial_menu"] = {}
-
-            config_data["radial_menu"]["slices"] = slices
-
-            # Save
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, indent=2)
-
-            print("Radial menu configuration saved!")
-
-            # Notify daemon to reload
-            try:
-                bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-                proxy = Gio.DBusProxy.new_sync(
-                    bus,
-                    Gio.DBusProxyFlags.NONE,
-                    None,
-                    "org.kde.juhradialmx",
-                    "/org/kde/juhradialmx/Daemon",
-                    "org.kde.juhradialmx.Daemon",
-                    None,
-                )
-                proxy.call_sync("ReloadConfig", None, Gio.DBusCallFlags.NONE, 500, None)
-            except GLib.Error:
-                pass  # Daemon may not be running
-
-        except Exception as e:
-            print(f"Failed to save profile: {e}")
+        # Persist only the slices: other pages' unapplied edits stay unsaved.
+        # Flushed so an unreadable config.json keeps the dialog open (the
+        # save is skipped and reported) instead of being overwritten
+        config.set("radial_menu", "slices", slices)
+        config.save_key("radial_menu", "slices")
+        if not config.flush():
+            return
+        print("Radial menu configuration saved!")
 
         self.close()
 
@@ -765,6 +742,102 @@ class SliceConfigDialog(Adw.Window):
         self.close()
 
 
+_DESKTOP_DIRS = (
+    Path("/usr/share/applications"),
+    Path.home() / ".local/share/applications",
+    Path("/var/lib/flatpak/exports/share/applications"),
+    Path.home() / ".local/share/flatpak/exports/share/applications",
+)
+# Binary -> app name index, valid while the directory mtimes are unchanged
+_desktop_apps_cache = {"mtimes": None, "apps": {}}
+
+# D-Bus names of running apps, e.g. org.kde.dolphin-12345, org.mozilla.firefox
+_KDE_APP_NAME_RE = re.compile(r"org\.kde\.(\w+)-\d+")
+_ORG_APP_NAME_RE = re.compile(r"org\.(\w+)\.(\w+)")
+_KDE_IGNORED_APPS = frozenset({"KWin", "plasmashell", "kded", "kglobalaccel"})
+_APP_NAME_ORGS = frozenset({"mozilla", "chromium", "gnome", "gtk"})
+
+# Common GUI apps recognised by process name alone
+_KNOWN_GUI_PROCS = frozenset(
+    {
+        "firefox",
+        "chrome",
+        "chromium",
+        "code",
+        "konsole",
+        "dolphin",
+        "kate",
+        "okular",
+        "gwenview",
+        "spectacle",
+        "gimp",
+        "blender",
+        "inkscape",
+        "kwrite",
+        "vlc",
+        "mpv",
+        "obs",
+        "slack",
+        "discord",
+        "telegram-desktop",
+        "signal-desktop",
+        "spotify",
+        "thunderbird",
+        "evolution",
+        "nautilus",
+        "gedit",
+    }
+)
+
+
+def _installed_desktop_apps():
+    """Map binary names to app names from installed .desktop files
+
+    The scan is cached until one of the application directories changes
+    (installing or removing an app updates the directory mtime).
+    """
+    mtimes = []
+    for desktop_dir in _DESKTOP_DIRS:
+        try:
+            mtimes.append(desktop_dir.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)  # Directory missing
+    mtimes = tuple(mtimes)
+    if mtimes == _desktop_apps_cache["mtimes"]:
+        return _desktop_apps_cache["apps"]
+
+    installed_apps = {}
+    for desktop_dir, mtime in zip(_DESKTOP_DIRS, mtimes):
+        if mtime is None:
+            continue
+        for desktop_file in desktop_dir.glob("*.desktop"):
+            try:
+                # Extract Exec line to get binary name, reading only up to it
+                with desktop_file.open() as f:
+                    for line in f:
+                        if line.startswith("Exec="):
+                            exec_args = line[5:].split()
+                            break
+                    else:
+                        continue
+                if not exec_args:
+                    continue
+                binary = Path(exec_args[0]).name  # First word after Exec=
+                # Map binary to desktop file name (app name)
+                app_name = desktop_file.stem
+                # Use shorter name if it's a reverse-domain style
+                if "." in app_name:
+                    parts = app_name.split(".")
+                    app_name = parts[-1] if len(parts) > 2 else app_name
+                installed_apps[binary] = app_name
+            except (IOError, OSError, UnicodeDecodeError):
+                pass  # Desktop file not readable
+
+    _desktop_apps_cache["mtimes"] = mtimes
+    _desktop_apps_cache["apps"] = installed_apps
+    return installed_apps
+
+
 class AddApplicationDialog(Adw.Window):
     """Dialog for adding a per-application profile"""
 
@@ -823,10 +896,21 @@ class AddApplicationDialog(Adw.Window):
 
         self.app_list = Gtk.ListBox()
         self.app_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
+        self._checked_row = None  # Row currently showing the checkmark
         self.app_list.add_css_class("boxed-list")
 
-        # Get running applications
-        self._populate_running_apps()
+        # Detect running applications off the UI thread (runs qdbus and ps,
+        # and scans .desktop files); show a loading row meanwhile
+        self._loading_row = Adw.ActionRow()
+        self._loading_row.set_title(_("Detecting applications..."))
+        self._loading_row.set_activatable(False)
+        self._loading_row.set_selectable(False)
+        spinner = Gtk.Spinner()
+        spinner.start()
+        self._loading_row.add_suffix(spinner)
+        self.app_list.append(self._loading_row)
+
+        threading.Thread(target=self._detect_apps_thread, daemon=True).start()
 
         scrolled.set_child(self.app_list)
         app_card.append(scrolled)
@@ -854,11 +938,15 @@ class AddApplicationDialog(Adw.Window):
         main_box.append(content)
         self.set_content(main_box)
 
-    def _populate_running_apps(self):
-        """Get list of running applications using D-Bus and process detection"""
-        import subprocess
-        import re
+    def _detect_apps_thread(self):
+        apps = self._detect_running_apps()
+        GLib.idle_add(self._populate_running_apps, apps)
+
+    def _detect_running_apps(self):
+        """Get set of running applications using D-Bus and process detection
 
+        Runs on a worker thread - must not touch widgets.
+        """
         apps = set()
 
         try:
@@ -871,21 +959,16 @@ class AddApplicationDialog(Adw.Window):
                 for line in result.stdout.strip().split("\n"):
                     line = line.strip()
                     # Match patterns like org.kde.dolphin-12345
-                    match = re.match(r"org\.kde\.(\w+)-\d+", line)
+                    match = _KDE_APP_NAME_RE.match(line)
                     if match:
                         app_name = match.group(1)
-                        if app_name not in (
-                            "KWin",
-                            "plasmashell",
-                            "kded",
-                            "kglobalaccel",
-                        ):
+                        if app_name not in _KDE_IGNORED_APPS:
                             apps.add(app_name)
                     # Also match org.mozilla.firefox, org.chromium, etc.
-                    match = re.match(r"org\.(\w+)\.(\w+)", line)
+                    match = _ORG_APP_NAME_RE.match(line)
                     if match:
                         org, app = match.group(1), match.group(2)
-                        if org in ("mozilla", "chromium", "gnome", "gtk"):
+                        if org in _APP_NAME_ORGS:
                             apps.add(app.lower())
         except Exception as e:
             print(f"D-Bus app detection failed: {e}")
@@ -893,39 +976,7 @@ class AddApplicationDialog(Adw.Window):
         try:
             # Method 2: Check for GUI processes with known .desktop files
             # Look at running processes and match against installed apps
-            desktop_dirs = [
-                Path("/usr/share/applications"),
-                Path.home() / ".local/share/applications",
-                Path("/var/lib/flatpak/exports/share/applications"),
-                Path.home() / ".local/share/flatpak/exports/share/applications",
-            ]
-
-            # Get all installed app names from .desktop files
-            installed_apps = {}
-            for desktop_dir in desktop_dirs:
-                if desktop_dir.exists():
-                    for desktop_file in desktop_dir.glob("*.desktop"):
-                        try:
-                            content = desktop_file.read_text()
-                            # Extract Exec line to get binary name
-                            for line in content.split("\n"):
-                                if line.startswith("Exec="):
-                                    exec_cmd = line[5:].split()[
-                                        0
-                                    ]  # Get first word after Exec=
-                                    binary = Path(exec_cmd).name
-                                    # Map binary to desktop file name (app name)
-                                    app_name = desktop_file.stem
-                                    # Use shorter name if it's a reverse-domain style
-                                    if "." in app_name:
-                                        parts = app_name.split(".")
-                                        app_name = (
-                                            parts[-1] if len(parts) > 2 else app_name
-                                        )
-                                    installed_apps[binary] = app_name
-                                    break
-                        except (IOError, OSError, UnicodeDecodeError):
-                            pass  # Desktop file not readable
+            installed_apps = _installed_desktop_apps()
 
             # Get running process names
             result = subprocess.run(
@@ -941,38 +992,18 @@ class AddApplicationDialog(Adw.Window):
                     if proc in installed_apps:
                         apps.add(installed_apps[proc])
                     # Also check common GUI apps directly
-                    elif proc in (
-                        "firefox",
-                        "chrome",
-                        "chromium",
-                        "code",
-                        "konsole",
-                        "dolphin",
-                        "kate",
-                        "okular",
-                        "gwenview",
-                        "spectacle",
-                        "gimp",
-                        "blender",
-                        "inkscape",
-                        "kwrite",
-                        "vlc",
-                        "mpv",
-                        "obs",
-                        "slack",
-                        "discord",
-                        "telegram-desktop",
-                        "signal-desktop",
-                        "spotify",
-                        "thunderbird",
-                        "evolution",
-                        "nautilus",
-                        "gedit",
-                    ):
+                    elif proc in _KNOWN_GUI_PROCS:
                         apps.add(proc)
         except Exception as e:
             print(f"Process detection failed: {e}")
 
+        return apps
+
+    def _populate_running_apps(self, apps):
+        """Fill the app list with detected apps followed by common ones"""
+        self.app_list.remove(self._loading_row)
+        self._loading_row = None
+
         # Add some common apps that user might want (grayed out if not detected)
         common_apps = [
             "firefox",
@@ -1024,19 +1055,19 @@ class AddApplicationDialog(Adw.Window):
             self.app_list.append(row)
 
         self.app_list.connect("row-selected", self._on_app_selected)
+        return False
 
     def _on_app_selected(self, list_box, row):
         """Handle app selection"""
-        # Clear all checkmarks
-        child = list_box.get_first_child()
-        while child:
-            if hasattr(child, "check_icon"):
-                child.check_icon.set_visible(False)
-            child = child.get_next_sibling()
+        # Clear the previous checkmark (only one row is ever checked)
+        if self._checked_row is not None:
+            self._checked_row.check_icon.set_visible(False)
+            self._checked_row = None
 
         # Show checkmark on selected
         if row and hasattr(row, "check_icon"):
             row.check_icon.set_visible(True)
+            self._checked_row = row
             if hasattr(row, "app_name"):
                 self.app_entry.set_text(row.app_name)
 
@@ -1054,7 +1085,7 @@ class AddApplicationDialog(Adw.Window):
             return
 
         # Save profile
-        profile_path = Path.home() / ".config" / "juhradial" / "profiles.json"
+        profile_path = ConfigManager.CONFIG_DIR / "profiles.json"
 
         try:
             profiles = {}
@@ -1115,7 +1146,7 @@ class ApplicationProfilesGridDialog(Adw.Window):
         self.set_default_size(780, 560)
         self.add_css_class("background")
 
-        self.profile_path = Path.home() / ".config" / "juhradial" / "profiles.json"
+        self.profile_path = ConfigManager.CONFIG_DIR / "profiles.json"
 
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
 
@@ -1286,7 +1317,7 @@ class AppProfileSlicesDialog(Adw.Window):
         self.add_css_class("background")
         self.parent_dialog = parent
         self.app_name = app_name
-        self.profile_path = Path.home() / ".config" / "juhradial" / "profiles.json"
+        self.profile_path = ConfigManager.CONFIG_DIR / "profiles.json"
         self.set_title(_("Edit Profile: {}").format(app_name))
         self.set_default_size(560, 640)
 
@@ -17,6 +17,7 @@ from i18n import _
 from settings_config import ConfigManager
 from settings_constants import MOUSE_BUTTONS, translate_radial_label
 from settings_dialogs import RadialMenuConfigDialog, SliceConfigDialog
+from themes import hex_to_rgb
 
 
 class ButtonsPage(Gtk.ScrolledWindow):
@@ -192,14 +193,23 @@ class ButtonsPage(Gtk.ScrolledWindow):
         header.add_css_class("button-assignment-header")
         assignments_card.append(header)
 
-        # Button rows container
+        # Button rows container - one row-activated handler for every row
         self.button_rows = {}
         self.action_labels = {}
 
+        button_list = Gtk.ListBox()
+        button_list.set_selection_mode(Gtk.SelectionMode.NONE)
+        button_list.set_activate_on_single_click(True)
+        button_list.add_css_class("button-list")
+        button_list.connect(
+            "row-activated", lambda _, row: self._on_button_click(row.btn_id)
+        )
+
         for btn_id, btn_info in MOUSE_BUTTONS.items():
             row = self._create_button_row(btn_id, btn_info)
             self.button_rows[btn_id] = row
-            assignments_card.append(row)
+            button_list.append(row)
+        assignments_card.append(button_list)
 
         content.append(assignments_card)
         self.set_child(content)
@@ -207,7 +217,6 @@ class ButtonsPage(Gtk.ScrolledWindow):
     def _create_button_row(self, btn_id, btn_info):
         """Create a premium styled button assignment row"""
         row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=14)
-        row.add_css_class("button-row")
 
         # Icon box
         icon_box = Gtk.Box()
@@ -240,23 +249,17 @@ class ButtonsPage(Gtk.ScrolledWindow):
 
         row.append(text_box)
 
-        # Arrow button
-        arrow = Gtk.Button()
-        arrow.set_child(Gtk.Image.new_from_icon_name("go-next-symbolic"))
+        # Arrow indicator (the whole row is activatable)
+        arrow = Gtk.Image.new_from_icon_name("go-next-symbolic")
         arrow.add_css_class("button-arrow")
-        arrow.add_css_class("flat")
         arrow.set_valign(Gtk.Align.CENTER)
-        arrow.connect("clicked", lambda _, bid=btn_id: self._on_button_click(bid))
         row.append(arrow)
 
-        # Make entire row clickable
-        row_click = Gtk.GestureClick()
-        row_click.connect(
-            "released", lambda g, n, x, y, bid=btn_id: self._on_button_click(bid)
-        )
-        row.add_controller(row_click)
-
-        return row
+        list_row = Gtk.ListBoxRow()
+        list_row.add_css_class("button-row")
+        list_row.set_child(row)
+        list_row.btn_id = btn_id
+        return list_row
 
     def _on_button_click(self, button_id):
         """Handle button configuration click"""
@@ -292,16 +295,13 @@ class ButtonsPage(Gtk.ScrolledWindow):
         # Color indicator dot
         color_name = slice_data.get("color", "teal")
         color_hex = self.SLICE_COLORS.get(color_name, "#0abdc6")
+        r, g, b = (c / 255.0 for c in hex_to_rgb(color_hex))
 
         color_dot = Gtk.DrawingArea()
         color_dot.set_size_request(10, 10)
         color_dot.set_valign(Gtk.Align.CENTER)
 
         def draw_dot(area, cr, width, height):
-            # Parse color
-            r = int(color_hex[1:3], 16) / 255.0
-            g = int(color_hex[3:5], 16) / 255.0
-            b = int(color_hex[5:7], 16) / 255.0
             # Draw filled circle
             cr.set_source_rgb(r, g, b)
             cr.arc(width / 2, height / 2, 4, 0, 2 * 3.14159)
@@ -11,10 +11,10 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 
-from gi.repository import Gtk, Gio
+from gi.repository import Gtk, GLib
 
 from i18n import _
-from settings_config import config
+from settings_config import call_daemon, config
 from settings_widgets import SettingsCard, SettingRow
 
 
@@ -149,12 +149,9 @@ class HapticsPage(Gtk.ScrolledWindow):
         # Save to config (in-memory)
         callback(pattern)
 
-        # Save config to file so daemon can read it
+        # Save config to file - this also asks the daemon to reload it
         config.save(show_toast=False)
 
-        # Reload daemon config to apply instantly
-        self._reload_daemon_config()
-
     def _apply_pattern_to_all(self, pattern):
         """Apply the selected pattern to all event types"""
         if not pattern:
@@ -177,51 +174,10 @@ class HapticsPage(Gtk.ScrolledWindow):
         for key, dropdown in self.event_dropdowns.items():
             dropdown.set_active(pattern_index)
 
-        # Save config to file so daemon can read it
+        # Save config to file - this also asks the daemon to reload it
         config.save(show_toast=False)
 
-        # Reload daemon config to apply all patterns instantly
-        self._reload_daemon_config()
-
-    def _reload_daemon_config(self):
-        """Reload daemon config via D-Bus to apply haptic pattern changes instantly"""
-        try:
-            bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-            proxy = Gio.DBusProxy.new_sync(
-                bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                "org.kde.juhradialmx",
-                "/org/kde/juhradialmx/Daemon",
-                "org.kde.juhradialmx.Daemon",
-                None,
-            )
-            proxy.call_sync("ReloadConfig", None, Gio.DBusCallFlags.NONE, 2000, None)
-            print("Daemon config reloaded - haptic patterns applied")
-        except Exception as e:
-            print(f"Failed to reload daemon config: {e}")
-
     def _on_test_clicked(self, button):
         """Send a test haptic pulse via D-Bus"""
-        try:
-            bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-            proxy = Gio.DBusProxy.new_sync(
-                bus,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                "org.kde.juhradialmx",
-                "/org/kde/juhradialmx/Daemon",
-                "org.kde.juhradialmx.Daemon",
-                None,
-            )
-            # Trigger haptic with "menu_appear" event to test the pattern
-            proxy.call_sync(
-                "TriggerHaptic",
-                GLib.Variant("(s)", ("menu_appear",)),
-                Gio.DBusCallFlags.NONE,
-                2000,
-                None,
-            )
-            print("Test haptic triggered")
-        except Exception as e:
-            print(f"Failed to send test haptic: {e}")
+        # Trigger haptic with "menu_appear" event to test the pattern
+        call_daemon("TriggerHaptic", GLib.Variant("(s)", ("menu_appear",)), 2000)
@@ -8,6 +8,7 @@ SPDX-License-Identifier: GPL-3.0
 """
 
 import json
+import math
 
 import gi
 
@@ -18,15 +19,45 @@ from gi.repository import Gtk, GLib, Gio
 from i18n import _
 from settings_config import config, disable_scroll_on_scale
 from settings_theme import COLORS
+from themes import hex_to_rgb
 from settings_widgets import SettingsCard, SettingRow
 
+# Theme hex color -> cairo RGBA, parsed once per color
+_RGBA_CACHE = {}
+
+_MOUSE_SCHEMA = "org.gnome.desktop.peripherals.mouse"
+_mouse_settings = None
+
+
+def _get_mouse_settings():
+    """Shared GNOME mouse settings handle, or None if the schema is not installed"""
+    global _mouse_settings
+    if _mouse_settings is None:
+        # Gio.Settings.new() aborts on an unknown schema, so look it up first
+        source = Gio.SettingsSchemaSource.get_default()
+        if source is None or source.lookup(_MOUSE_SCHEMA, True) is None:
+            return None
+        _mouse_settings = Gio.Settings.new(_MOUSE_SCHEMA)
+    return _mouse_settings
+
 
 class DPIVisualSlider(Gtk.Box):
     """Visual DPI slider with gradient bar and value display"""
 
+    # Dragging emits value-changed per pixel; on_change (device + gsettings
+    # writes) runs at most once per frame with the latest value
+    CHANGE_INTERVAL_MS = 16
+
+    # Value markup is rebuilt per tick while dragging; only the number varies
+    _DPI_MARKUP_PREFIX = f'<span size="xx-large" weight="bold" color="{COLORS["mauve"]}">'
+    _DPI_MARKUP_SUFFIX = "</span>"
+
     def __init__(self, on_change=None):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         self.on_change = on_change
+        self._pending_dpi = None
+        self._last_sent_dpi = None
+        self._change_source_id = None
 
         # Header with title and DPI value
         header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
@@ -51,7 +82,7 @@ class DPIVisualSlider(Gtk.Box):
         self.dpi_label = Gtk.Label()
         self.dpi_label.add_css_class("title-1")
         self.dpi_label.set_markup(
-            f'<span size="xx-large" weight="bold" color="{COLORS["mauve"]}">1600</span>'
+            self._DPI_MARKUP_PREFIX + "1600" + self._DPI_MARKUP_SUFFIX
         )
         dpi_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         dpi_box.append(self.dpi_label)
@@ -108,15 +139,32 @@ class DPIVisualSlider(Gtk.Box):
     def _on_value_changed(self, scale):
         dpi = int(scale.get_value())
         self.dpi_label.set_markup(
-            f'<span size="xx-large" weight="bold" color="{COLORS["mauve"]}">{dpi}</span>'
+            self._DPI_MARKUP_PREFIX + str(dpi) + self._DPI_MARKUP_SUFFIX
         )
         if self.on_change:
+            self._pending_dpi = dpi
+            if self._change_source_id is None:
+                self._change_source_id = GLib.timeout_add(
+                    self.CHANGE_INTERVAL_MS, self._flush_change
+                )
+
+    def _flush_change(self):
+        self._change_source_id = None
+        dpi = self._pending_dpi
+        if dpi != self._last_sent_dpi:
+            self._last_sent_dpi = dpi
             self.on_change(dpi)
+        return False
 
 
 class ScrollWheelVisual(Gtk.DrawingArea):
     """Visual representation of scroll wheel mode"""
 
+    # Unit direction of each of the 8 ridges, 45 degrees apart
+    RIDGE_DIRECTIONS = tuple(
+        (math.cos(i * math.pi / 4), math.sin(i * math.pi / 4)) for i in range(8)
+    )
+
     def __init__(self, is_smartshift=True):
         super().__init__()
         self.is_smartshift = is_smartshift
@@ -142,36 +190,38 @@ class ScrollWheelVisual(Gtk.DrawingArea):
         color = COLORS["mauve"] if self.is_smartshift else COLORS["subtext0"]
         cr.set_source_rgba(*self._hex_to_rgba(color))
 
-        # Draw ridges
-        for i in range(8):
-            angle = i * math.pi / 4
-            x1 = cx + (radius - 8) * math.cos(angle)
-            y1 = cy + (radius - 8) * math.sin(angle)
-            x2 = cx + (radius - 2) * math.cos(angle)
-            y2 = cy + (radius - 2) * math.sin(angle)
-            cr.set_line_width(2)
-            cr.move_to(x1, y1)
-            cr.line_to(x2, y2)
-            cr.stroke()
+        # Draw ridges (one path, stroked once)
+        inner = radius - 8
+        outer = radius - 2
+        cr.set_line_width(2)
+        for cos_a, sin_a in self.RIDGE_DIRECTIONS:
+            cr.move_to(cx + inner * cos_a, cy + inner * sin_a)
+            cr.line_to(cx + outer * cos_a, cy + outer * sin_a)
+        cr.stroke()
 
         # Center dot
         cr.arc(cx, cy, 4, 0, 2 * math.pi)
         cr.fill()
 
     def _hex_to_rgba(self, hex_color):
-        hex_color = hex_color.lstrip("#")
-        r = int(hex_color[0:2], 16) / 255
-        g = int(hex_color[2:4], 16) / 255
-        b = int(hex_color[4:6], 16) / 255
-        return (r, g, b, 1.0)
+        rgba = _RGBA_CACHE.get(hex_color)
+        if rgba is None:
+            r, g, b = hex_to_rgb(hex_color)
+            rgba = _RGBA_CACHE[hex_color] = (r / 255, g / 255, b / 255, 1.0)
+        return rgba
 
 
 class ScrollPage(Gtk.ScrolledWindow):
     """Sensitivity settings page - Mouse pointer, scroll wheel, and button sensitivity"""
 
+    # Sliders change per pixel while dragged; the settings writes, helper
+    # processes and SmartShift D-Bus calls they drive run at most this often
+    APPLY_INTERVAL_MS = 150
+
     def __init__(self):
         super().__init__()
         self.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        self._pending_apply = {}  # apply method -> latest args
 
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24)
         content.set_margin_top(24)
@@ -464,7 +514,7 @@ class ScrollPage(Gtk.ScrolledWindow):
         # Apply to hardware via D-Bus
         self._apply_dpi_to_device(dpi)
         # Also apply pointer speed via gsettings (software multiplier)
-        self._apply_pointer_speed(dpi)
+        self._apply_throttled(self._apply_pointer_speed, dpi)
         # Show pending changes indicator
         self._show_pending_changes()
 
@@ -472,21 +522,9 @@ class ScrollPage(Gtk.ScrolledWindow):
         profile = combo.get_active_id()
         config.set("pointer", "accel_profile", profile)
         # Apply immediately
-        try:
-            import subprocess
-
-            subprocess.run(
-                [
-                    "gsettings",
-                    "set",
-                    "org.gnome.desktop.peripherals.mouse",
-                    "accel-profile",
-                    profile,
-                ],
-                capture_output=True,
-            )
-        except (FileNotFoundError, subprocess.SubprocessError):
-            pass  # gsettings not available
+        settings = _get_mouse_settings()
+        if settings is not None:
+            settings.set_string("accel-profile", profile)
 
     def _on_smartshift_changed(self, switch, state):
         config.set("scroll", "smartshift", state)
@@ -498,7 +536,9 @@ class ScrollPage(Gtk.ScrolledWindow):
         # Convert UI percentage (1-100) to device threshold (0-255)
         # Lower threshold = more sensitive, so we invert the percentage
         device_threshold = int((100 - threshold) * 2.55)
-        self._apply_smartshift_to_device(state, device_threshold)
+        # Shares the threshold slider's slot so a pending drag value cannot
+        # land afterwards with a stale enabled flag
+        self._apply_throttled(self._apply_smartshift_to_device, state, device_threshold)
 
         return False
 
@@ -512,7 +552,7 @@ class ScrollPage(Gtk.ScrolledWindow):
         # Convert UI percentage (1-100) to device threshold (0-255)
         # Lower threshold = more sensitive, so we invert the percentage
         device_threshold = int((100 - value) * 2.55)
-        self._apply_smartshift_to_device(enabled, device_threshold)
+        self._apply_throttled(self._apply_smartshift_to_device, enabled, device_threshold)
 
         self._show_pending_changes()
 
@@ -521,22 +561,10 @@ class ScrollPage(Gtk.ScrolledWindow):
 
     def _on_natural_changed(self, switch, state):
         config.set("scroll", "natural", state)
-        # Apply immediately via gsettings
-        try:
-            import subprocess
-
-            subprocess.run(
-                [
-                    "gsettings",
-                    "set",
-                    "org.gnome.desktop.peripherals.mouse",
-                    "natural-scroll",
-                    "true" if state else "false",
-                ],
-                capture_output=True,
-            )
-        except (FileNotFoundError, subprocess.SubprocessError):
-            pass  # gsettings not available
+        # Apply immediately via GSettings
+        settings = _get_mouse_settings()
+        if settings is not None:
+            settings.set_boolean("natural-scroll", state)
         # Also apply to device via D-Bus HiResScroll
         self._apply_hiresscroll_to_device()
         return False
@@ -553,7 +581,17 @@ class ScrollPage(Gtk.ScrolledWindow):
         value = int(scale.get_value())
         config.set("scroll", "speed", value)
         # Apply scroll lines setting via imwheel or gsettings
-        self._apply_scroll_speed(value)
+        self._apply_throttled(self._apply_scroll_speed, value)
+
+    def _apply_throttled(self, apply, *args):
+        """Run apply(*args) at most once per APPLY_INTERVAL_MS, with the latest args"""
+        if apply not in self._pending_apply:
+            GLib.timeout_add(self.APPLY_INTERVAL_MS, self._flush_apply, apply)
+        self._pending_apply[apply] = args
+
+    def _flush_apply(self, apply):
+        apply(*self._pending_apply.pop(apply))
+        return False
 
     def _apply_scroll_speed(self, lines):
         """Apply scroll speed multiplier - works on GNOME, KDE, Hyprland, etc."""
@@ -749,25 +787,14 @@ None,      Down, Button5, {lines}
             print(f"Failed to get HiResScroll via D-Bus: {e}")
 
     def _apply_pointer_speed(self, dpi):
-        """Apply pointer speed via gsettings (-1.0 to 1.0)"""
-        try:
-            import subprocess
-
-            # Convert DPI (400-8000) to gsettings speed (-1.0 to 1.0)
-            speed = (dpi - 4200) / 3800  # Maps 400->-1.0, 8000->1.0
-            speed = max(-1.0, min(1.0, speed))
-            subprocess.run(
-                [
-                    "gsettings",
-                    "set",
-                    "org.gnome.desktop.peripherals.mouse",
-                    "speed",
-                    str(speed),
-                ],
-                capture_output=True,
-            )
-        except (FileNotFoundError, subprocess.SubprocessError):
-            pass  # gsettings not available
+        """Apply pointer speed via GSettings (-1.0 to 1.0)"""
+        settings = _get_mouse_settings()
+        if settings is None:
+            return  # GNOME mouse schema not installed
+
+        # Convert DPI (400-8000) to gsettings speed (-1.0 to 1.0)
+        speed = (dpi - 4200) / 3800  # Maps 400->-1.0, 8000->1.0
+        settings.set_double("speed", max(-1.0, min(1.0, speed)))
 
     def _apply_dpi_to_device(self, dpi):
         """Apply DPI directly to the mouse via D-Bus"""
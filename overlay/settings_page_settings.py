@@ -7,7 +7,8 @@ SettingsPage: Appearance, language, and application settings.
 SPDX-License-Identifier: GPL-3.0
 """
 
-import json
+import copy
+import subprocess
 from pathlib import Path
 
 import gi
@@ -21,7 +22,7 @@ from i18n import _, SUPPORTED_LANGUAGES
 from settings_config import ConfigManager, config, get_device_name
 import settings_theme
 from settings_widgets import SettingsCard, SettingRow
-from themes import get_theme_list
+from themes import OVERLAY_BUS_NAME, get_theme_list
 
 
 class SettingsPage(Gtk.ScrolledWindow):
@@ -86,6 +87,7 @@ class SettingsPage(Gtk.ScrolledWindow):
             if idx < len(lang_keys):
                 config.set("language", lang_keys[idx])
                 config.save(show_toast=False)
+                config.flush()  # reload_language() reads it from disk
                 # Reload translations and recreate window
                 from i18n import reload_language
 
@@ -199,37 +201,57 @@ class SettingsPage(Gtk.ScrolledWindow):
 
     def _on_theme_changed(self, dropdown, _):
         """Handle theme selection change - applies to both overlay and settings"""
-        import subprocess
-
         selected = dropdown.get_selected()
         if 0 <= selected < len(self._theme_keys):
             theme = self._theme_keys[selected]
             config.set("theme", theme)
-            config.save(show_toast=False)  # Save immediately so overlay picks it up
+            config.save(show_toast=False)
+            config.flush()  # On disk before an overlay may be started below
             print(f"Theme changed to: {theme}")
 
             # Reload CSS for the settings window
             self._reload_theme_css()
 
-            # Restart the overlay to apply the new theme
-            overlay_path = None
+            # A running overlay re-reads the theme from config each time the
+            # menu opens, so it needs no restart - only start one if absent
             try:
-                # Kill the old overlay
-                subprocess.run(
-                    ["pkill", "-f", "juhradial-overlay.py"],
-                    capture_output=True,
-                    timeout=2,
-                )
-                # Start new overlay with new theme
-                overlay_path = Path(__file__).parent / "juhradial-overlay.py"
-                subprocess.Popen(
-                    ["python3", str(overlay_path)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
+                bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+                bus.call(
+                    "org.freedesktop.DBus",
+                    "/org/freedesktop/DBus",
+                    "org.freedesktop.DBus",
+                    "NameHasOwner",
+                    GLib.Variant("(s)", (OVERLAY_BUS_NAME,)),
+                    GLib.VariantType("(b)"),
+                    Gio.DBusCallFlags.NONE,
+                    500,
+                    None,
+                    self._on_overlay_checked,
                 )
-                print("Overlay restarted with new theme")
-            except Exception as e:
-                print(f"Could not restart overlay: {e}")
+            except GLib.Error as e:
+                print(f"Could not check for running overlay: {e.message}")
+
+    def _on_overlay_checked(self, bus, result):
+        """Start the overlay with the new theme if it is not running"""
+        try:
+            (running,) = bus.call_finish(result).unpack()
+        except GLib.Error as e:
+            print(f"Could not check for running overlay: {e.message}")
+            return
+        if running:
+            print("Overlay will use the new theme next time the menu opens")
+            return
+
+        try:
+            overlay_path = Path(__file__).parent / "juhradial-overlay.py"
+            subprocess.Popen(
+                ["python3", str(overlay_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            print("Overlay started with new theme")
+        except Exception as e:
+            print(f"Could not start overlay: {e}")
 
     def _reload_theme_css(self):
         """Reload CSS with new theme colors"""
@@ -246,15 +268,18 @@ class SettingsPage(Gtk.ScrolledWindow):
         # Regenerate CSS with new colors
         new_css = settings_theme.generate_css()
 
-        # Apply new CSS
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(new_css.encode())
-
-        # Get the display and apply
-        display = Gdk.Display.get_default()
-        Gtk.StyleContext.add_provider_for_display(
-            display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # Reload the app's provider in place so old stylesheets don't pile up
+        app = Gio.Application.get_default()
+        css_provider = getattr(app, "css_provider", None)
+        if css_provider is not None:
+            css_provider.load_from_data(new_css.encode())
+        else:
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(new_css.encode())
+            display = Gdk.Display.get_default()
+            Gtk.StyleContext.add_provider_for_display(
+                display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
         print("Settings CSS reloaded with new theme")
 
     def _on_startup_changed(self, switch, state):
@@ -295,7 +320,7 @@ X-GNOME-Autostart-enabled=true
     def _on_reset_clicked(self, button):
         """Reset all settings to defaults"""
         global config
-        config.config = json.loads(json.dumps(ConfigManager.DEFAULT_CONFIG))
+        config.config = copy.deepcopy(ConfigManager.DEFAULT_CONFIG)
         config.save()
         print("Settings reset to defaults")
         # Show notification
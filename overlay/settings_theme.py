@@ -8,7 +8,7 @@ Supports dark and light themes with dynamic accent colors.
 SPDX-License-Identifier: GPL-3.0
 """
 
-from themes import get_colors, is_dark_theme
+from themes import get_colors, hex_to_rgb, is_dark_theme
 
 
 # =============================================================================
@@ -20,9 +20,7 @@ def load_colors():
     # Add computed glow color based on accent
     accent = colors.get('accent', '#00d4ff')
     # Parse hex to RGB for glow
-    r = int(accent[1:3], 16)
-    g = int(accent[3:5], 16)
-    b = int(accent[5:7], 16)
+    r, g, b = hex_to_rgb(accent)
     colors['accent_glow'] = f'rgba({r}, {g}, {b}, 0.4)'
     colors['accent_glow_light'] = f'rgba({r}, {g}, {b}, 0.15)'
     # Add missing legacy colors if needed
@@ -107,24 +105,6 @@ def generate_css():
         tooltip_bg = f"linear-gradient(135deg, {COLORS['surface0']} 0%, {COLORS['mantle']} 100%)"
 
     return f"""
-/* ============================================
-   GLOBAL TRANSITIONS & ANIMATIONS
-   ============================================ */
-@keyframes pulse-glow {{
-    0%, 100% {{ box-shadow: 0 0 20px {COLORS['accent_glow']}; }}
-    50% {{ box-shadow: 0 0 35px {COLORS['accent_glow']}; }}
-}}
-
-@keyframes subtle-pulse {{
-    0%, 100% {{ opacity: 1; }}
-    50% {{ opacity: 0.85; }}
-}}
-
-@keyframes slide-in {{
-    from {{ opacity: 0; transform: translateX(20px); }}
-    to {{ opacity: 1; transform: translateX(0); }}
-}}
-
 /* ============================================
    MAIN WINDOW
    ============================================ */
@@ -135,20 +115,6 @@ window.settings-window {{
 /* ============================================
    HEADER BAR - Premium Glass Effect
    ============================================ */
-.header-area {{
-    background: {COLORS['mantle']};
-    padding: 18px 28px;
-    border-bottom: 1px solid {border_subtle};
-    box-shadow: 0 4px 24px {shadow_color};
-}}
-
-.device-title {{
-    font-size: 26px;
-    font-weight: 700;
-    color: {COLORS['text']};
-    letter-spacing: 0.5px;
-}}
-
 .add-app-btn {{
     background: {COLORS['surface0']};
     color: {COLORS['accent']};
@@ -212,50 +178,6 @@ window.settings-window {{
     box-shadow: 0 6px 28px {COLORS['accent_glow']};
 }}
 
-/* ============================================
-   MAIN CONTENT AREA
-   ============================================ */
-.content-area {{
-    background: {COLORS['base']};
-}}
-
-/* ============================================
-   MOUSE VISUALIZATION AREA
-   ============================================ */
-.mouse-area {{
-    background: radial-gradient(ellipse at center, {COLORS['surface0']} 0%, {COLORS['base']} 70%);
-    padding: 40px;
-}}
-
-/* ============================================
-   BUTTON LABELS ON MOUSE - Premium Floating Tags
-   ============================================ */
-.button-label {{
-    background: {card_bg};
-    color: {COLORS['text']};
-    padding: 10px 16px;
-    border-radius: 10px;
-    font-size: 13px;
-    font-weight: 600;
-    box-shadow: 0 4px 20px {shadow_color_strong};
-    transition: all 250ms cubic-bezier(0.4, 0, 0.2, 1);
-    border: 1px solid {border_subtle};
-}}
-
-.button-label:hover {{
-    background: {COLORS['surface1']};
-    border-color: {COLORS['accent']};
-    box-shadow: 0 6px 28px {COLORS['accent_glow']};
-    color: {COLORS['accent']};
-}}
-
-.button-label.highlighted {{
-    background: linear-gradient(135deg, {COLORS['accent']} 0%, {COLORS['accent2']} 100%);
-    color: {text_on_accent};
-    box-shadow: 0 6px 28px {COLORS['accent_glow']};
-    border-color: transparent;
-}}
-
 /* ============================================
    SETTINGS CARDS - Glassmorphism Effect
    ============================================ */
@@ -550,53 +472,6 @@ tooltip {{
     color: {COLORS['text']};
 }}
 
-/* ============================================
-   SPECIAL EFFECTS - Glow Classes
-   ============================================ */
-.glow-accent {{
-    box-shadow: 0 0 20px {COLORS['accent_glow']};
-}}
-
-.glow-pulse {{
-    animation: pulse-glow 2s ease-in-out infinite;
-}}
-
-.animate-slide-in {{
-    animation: slide-in 300ms cubic-bezier(0.4, 0, 0.2, 1);
-}}
-
-/* ============================================
-   HAPTIC PATTERN LIST ITEMS
-   ============================================ */
-.haptic-pattern-item {{
-    padding: 14px 16px;
-    border-radius: 10px;
-    margin: 4px 0;
-    background: transparent;
-    border: 1px solid transparent;
-    transition: all 200ms cubic-bezier(0.4, 0, 0.2, 1);
-}}
-
-.haptic-pattern-item:hover {{
-    background: {accent_08};
-    border-color: {accent_15};
-}}
-
-.haptic-pattern-item.selected {{
-    background: linear-gradient(135deg, {accent_15} 0%, {accent2_10} 100%);
-    border-color: {COLORS['accent']};
-    box-shadow: 0 4px 16px {accent_20};
-}}
-
-/* ============================================
-   SECTION DIVIDERS
-   ============================================ */
-.section-divider {{
-    background: linear-gradient(90deg, transparent 0%, {accent_30} 50%, transparent 100%);
-    min-height: 1px;
-    margin: 20px 0;
-}}
-
 /* ============================================
    EASY-SWITCH SHORTCUTS CARD
    ============================================ */
@@ -662,6 +537,10 @@ tooltip {{
     border-bottom: 1px solid {accent_15};
 }}
 
+.button-list {{
+    background: transparent;
+}}
+
 .button-row {{
     background: {elevated_bg_hover};
     border-radius: 12px;
@@ -715,6 +594,7 @@ tooltip {{
     transition: all 200ms ease;
 }}
 
+.button-row:hover .button-arrow,
 .button-arrow:hover {{
     background: {accent_15};
     color: {COLORS['accent']};
@@ -761,24 +641,6 @@ tooltip {{
     margin-top: 4px;
 }}
 
-.configure-radial-btn {{
-    background: linear-gradient(135deg, {COLORS['accent']} 0%, {COLORS['accent2']} 100%);
-    color: {text_on_accent};
-    border: none;
-    border-radius: 10px;
-    padding: 12px 24px;
-    font-weight: 700;
-    font-size: 14px;
-    letter-spacing: 0.5px;
-    box-shadow: 0 4px 16px {accent_35};
-    transition: all 250ms cubic-bezier(0.4, 0, 0.2, 1);
-}}
-
-.configure-radial-btn:hover {{
-    box-shadow: 0 6px 24px {accent_50};
-    transform: translateY(-2px);
-}}
-
 /* Slice Row Styling */
 .slice-row {{
     background: {COLORS['surface0']};
@@ -845,17 +707,6 @@ tooltip {{
     border-color: {COLORS['accent']};
 }}
 
-/* Section Header */
-.section-header {{
-    font-size: 12px;
-    font-weight: 600;
-    color: {COLORS['subtext0']};
-    letter-spacing: 1.5px;
-    text-transform: uppercase;
-    margin-bottom: 12px;
-    margin-top: 8px;
-}}
-
 /* ============================================
    PREMIUM HEADER STYLING
    ============================================ */
@@ -926,6 +777,3 @@ tooltip {{
     transform: translateY(-1px);
 }}
 """
-
-# Generate CSS at module load time
-CSS = generate_css()
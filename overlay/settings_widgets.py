@@ -10,16 +10,21 @@ SPDX-License-Identifier: GPL-3.0
 
 import os
 import math
-import time
+from functools import lru_cache
 
+import cairo
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
+gi.require_version('Graphene', '1.0')
+gi.require_version('Gsk', '4.0')
 
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib, Graphene, Gsk
 
 from i18n import _
-from settings_constants import MOUSE_BUTTONS
+from settings_constants import MOUSE_BUTTONS, MOUSE_BUTTON_NAMES
+
+_TWO_PI = 2 * math.pi
 
 
 class NavButton(Gtk.Button):
@@ -51,9 +56,42 @@ class NavButton(Gtk.Button):
             self.remove_css_class('active')
 
 
+@lru_cache(maxsize=1)
+def _load_mouse_texture():
+    """Mouse image texture, decoded once and shared by every visualization"""
+    image_paths = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '../assets/devices/logitechmouse.png'),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets/devices/logitechmouse.png'),
+        '/usr/share/juhradial/assets/devices/logitechmouse.png',
+    ]
+    for path in image_paths:
+        if os.path.exists(path):
+            try:
+                return Gdk.Texture.new_from_filename(path)
+            except Exception as e:
+                print(f"Failed to load image: {e}")
+    return None
+
+
+@lru_cache(maxsize=32)
+def _rounded_rect_path(width, height, radius):
+    """Rounded rectangle path at the origin, built once per size"""
+    cr = cairo.Context(cairo.RecordingSurface(cairo.CONTENT_ALPHA, None))
+    cr.arc(radius, radius, radius, math.pi, 1.5 * math.pi)
+    cr.arc(width - radius, radius, radius, 1.5 * math.pi, _TWO_PI)
+    cr.arc(width - radius, height - radius, radius, 0, 0.5 * math.pi)
+    cr.arc(radius, height - radius, radius, 0.5 * math.pi, math.pi)
+    cr.close_path()
+    return cr.copy_path()
+
+
 class MouseVisualization(Gtk.DrawingArea):
     """Interactive mouse visualization with hoverable button labels"""
 
+    HOVER_RADIUS = 25  # Pointer distance that counts as hovering a button dot
+    LABEL_PADDING_X = 14
+    LABEL_PADDING_Y = 8
+
     def __init__(self, on_button_click=None):
         super().__init__()
         self.on_button_click = on_button_click
@@ -61,33 +99,24 @@ class MouseVisualization(Gtk.DrawingArea):
         self.mouse_image = None
         # Store image rect for button positioning
         self.img_rect = (0, 0, 600, 500)  # (x_offset, y_offset, width, height)
+        self._frame_size = (600, 500)  # Canvas size of the frame being drawn
         # Cache for hit regions (computed when img_rect changes)
         self._hit_cache = None
+        self._hit_bounds = None  # (left, top, right, bottom) around every region
+        self._label_cache = {}  # (label, hovered) -> extents, size, box path
+        self._frame_cache = {}  # (size, labels, hovered) -> rendered frame
         self._cached_img_rect = None
-        # Motion throttling
-        self._last_motion_time = 0
+        # Motion coalescing: keep the latest pointer position and hit-test
+        # it at most once per frame (~16ms)
+        self._last_xy = None
+        self._motion_source_id = None
 
         self.set_content_width(600)
         self.set_content_height(500)
         self.set_draw_func(self._draw)
 
-        # Load mouse image
-        image_paths = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '../assets/devices/logitechmouse.png'),
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets/devices/logitechmouse.png'),
-            '/usr/share/juhradial/assets/devices/logitechmouse.png',
-        ]
-
-        self._cached_pixbuf = None  # Cache pixbuf conversion (expensive)
-
-        for path in image_paths:
-            if os.path.exists(path):
-                try:
-                    self.mouse_image = Gdk.Texture.new_from_filename(path)
-                    self._cached_pixbuf = self._texture_to_pixbuf(self.mouse_image)
-                    break
-                except Exception as e:
-                    print(f"Failed to load image: {e}")
+        # Load mouse image (shared texture - textures are immutable)
+        self.mouse_image = _load_mouse_texture()
 
         # Mouse tracking
         motion = Gtk.EventControllerMotion()
@@ -101,9 +130,13 @@ class MouseVisualization(Gtk.DrawingArea):
         self.add_controller(click)
 
     def _compute_hit_regions(self):
-        """Pre-compute hit regions for all buttons (called when img_rect changes)"""
+        """Pre-compute hit regions for all buttons (called when img_rect changes)
+
+        Returns flat (btn_id, dot_x, dot_y, left, top, right, bottom) tuples so
+        the motion handler unpacks each one without any dict lookups.
+        """
         img_x, img_y, img_w, img_h = self.img_rect
-        hit_regions = {}
+        hit_regions = []
 
         for btn_id, btn_info in MOUSE_BUTTONS.items():
             btn_x = img_x + btn_info['pos'][0] * img_w
@@ -136,48 +169,73 @@ class MouseVisualization(Gtk.DrawingArea):
                 lx = btn_x - line_length - label_width
                 ly = btn_y - label_height / 2
 
-            hit_regions[btn_id] = {
-                'dot_x': btn_x,
-                'dot_y': btn_y,
-                'label_x': lx,
-                'label_y': ly,
-                'label_w': label_width,
-                'label_h': label_height,
-            }
-
-        return hit_regions
+            hit_regions.append(
+                (btn_id, btn_x, btn_y, lx, ly, lx + label_width, ly + label_height)
+            )
+
+        return tuple(hit_regions)
+
+    def _compute_hit_bounds(self, hit_regions):
+        """Bounding box of every dot hover circle and label box"""
+        if not hit_regions:
+            return (0, 0, -1, -1)
+        r = self.HOVER_RADIUS
+        _ids, dot_xs, dot_ys, lefts, tops, rights, bottoms = zip(*hit_regions)
+        return (
+            min(min(dot_xs) - r, min(lefts)),
+            min(min(dot_ys) - r, min(tops)),
+            max(max(dot_xs) + r, max(rights)),
+            max(max(dot_ys) + r, max(bottoms)),
+        )
 
     def _on_motion(self, controller, x, y):
-        # Throttle motion events to ~30fps (33ms between updates)
-        current_time = time.monotonic()
-        if current_time - self._last_motion_time < 0.033:
-            return
-        self._last_motion_time = current_time
-
+        self._last_xy = (x, y)
+        if self._motion_source_id is None:
+            self._motion_source_id = GLib.timeout_add(16, self._process_motion)
+
+    def _cancel_motion(self):
+        if self._motion_source_id is not None:
+            GLib.source_remove(self._motion_source_id)
+            self._motion_source_id = None
+
+    def _process_motion(self):
+        """Hit-test the latest coalesced pointer position"""
+        self._motion_source_id = None
+        if self._last_xy is not None:
+            self._update_hovered(*self._last_xy)
+        return False
+
+    def _update_hovered(self, x, y):
         # Rebuild hit cache if img_rect changed
         if self._hit_cache is None or self._cached_img_rect != self.img_rect:
             self._hit_cache = self._compute_hit_regions()
+            self._hit_bounds = self._compute_hit_bounds(self._hit_cache)
             self._cached_img_rect = self.img_rect
 
         # Check if hovering over any button region
         old_hovered = self.hovered_button
         self.hovered_button = None
 
+        # Pointer outside every dot and label - nothing to test
+        left, top, right, bottom = self._hit_bounds
+        if not (left <= x <= right and top <= y <= bottom):
+            if old_hovered is not None:
+                self.queue_draw()
+            return
+
         # Use squared distance comparison (625 = 25^2) to avoid sqrt
-        hover_radius_sq = 625
+        hover_radius_sq = self.HOVER_RADIUS * self.HOVER_RADIUS
 
-        for btn_id, region in self._hit_cache.items():
+        for btn_id, dot_x, dot_y, left, top, right, bottom in self._hit_cache:
             # Check dot (squared distance - no sqrt needed)
-            dx = x - region['dot_x']
-            dy = y - region['dot_y']
+            dx = x - dot_x
+            dy = y - dot_y
             if dx * dx + dy * dy < hover_radius_sq:
                 self.hovered_button = btn_id
                 break
 
             # Check label box
-            lx, ly = region['label_x'], region['label_y']
-            lw, lh = region['label_w'], region['label_h']
-            if lx <= x <= lx + lw and ly <= y <= ly + lh:
+            if left <= x <= right and top <= y <= bottom:
                 self.hovered_button = btn_id
                 break
 
@@ -185,41 +243,82 @@ class MouseVisualization(Gtk.DrawingArea):
             self.queue_draw()
 
     def _on_leave(self, controller):
+        self._cancel_motion()
+        self._last_xy = None
         if self.hovered_button:
             self.hovered_button = None
             self.queue_draw()
 
     def _on_click(self, gesture, n_press, x, y):
+        # Act on where the pointer is now, not the last processed frame
+        self._cancel_motion()
+        self._update_hovered(x, y)
         if self.hovered_button and self.on_button_click:
             self.on_button_click(self.hovered_button)
 
-    def _draw(self, area, cr, width, height):
-        # Draw mouse image centered
+    def _image_rect(self, width, height):
+        """(x, y, w, h) of the mouse image, or of the placeholder without one"""
+        if not self.mouse_image:
+            return (width * 0.2, height * 0.1, width * 0.6, height * 0.8)
+        img_width = self.mouse_image.get_width()
+        img_height = self.mouse_image.get_height()
+
+        # Scale to fit, centered
+        scale = min(width * 0.7 / img_width, height * 0.8 / img_height)
+        scaled_w = img_width * scale
+        scaled_h = img_height * scale
+        return ((width - scaled_w) / 2, (height - scaled_h) / 2, scaled_w, scaled_h)
+
+    def do_snapshot(self, snapshot):
+        # The mouse image goes to GSK as a texture node, scaled by the GPU
+        # renderer and sharp at any GDK_SCALE; the Cairo draw func only
+        # renders the labels on top of it
         if self.mouse_image:
-            img_width = self.mouse_image.get_width()
-            img_height = self.mouse_image.get_height()
-
-            # Scale to fit
-            scale = min(width * 0.7 / img_width, height * 0.8 / img_height)
-            scaled_w = img_width * scale
-            scaled_h = img_height * scale
-
-            x_offset = (width - scaled_w) / 2
-            y_offset = (height - scaled_h) / 2
-
-            # Store image rect for button positioning
-            self.img_rect = (x_offset, y_offset, scaled_w, scaled_h)
-
-            cr.save()
-            cr.translate(x_offset, y_offset)
-            cr.scale(scale, scale)
-            if self._cached_pixbuf:
-                Gdk.cairo_set_source_pixbuf(cr, self._cached_pixbuf, 0, 0)
-            cr.paint()
-            cr.restore()
-        else:
-            # Draw placeholder - store rect for button positioning
-            self.img_rect = (width * 0.2, height * 0.1, width * 0.6, height * 0.8)
+            x, y, w, h = self._image_rect(self.get_width(), self.get_height())
+            snapshot.append_scaled_texture(
+                self.mouse_image,
+                Gsk.ScalingFilter.TRILINEAR,
+                Graphene.Rect().init(x, y, w, h),
+            )
+        Gtk.DrawingArea.do_snapshot(self, snapshot)
+
+    def _draw(self, area, cr, width, height):
+        # Not allocated yet (initial map) - nothing to show
+        if width <= 1 or height <= 1:
+            return
+
+        # Whole frames are cached per hover state: the idle frame plus the
+        # most recently hovered one, so hover on/off is a single blit
+        scale_x, scale_y = cr.get_target().get_device_scale()
+        size_key = (width, height, scale_x, scale_y)
+        key = (size_key, tuple(MOUSE_BUTTON_NAMES), self.hovered_button)
+        frame = self._frame_cache.get(key)
+        if frame is None:
+            frame = cr.get_target().create_similar_image(
+                cairo.FORMAT_ARGB32,
+                max(math.ceil(width * scale_x), 1),
+                max(math.ceil(height * scale_y), 1),
+            )
+            frame.set_device_scale(scale_x, scale_y)
+            frame_cr = cairo.Context(frame)
+            frame_cr.set_font_options(cr.get_font_options())
+            self._draw_frame(frame_cr, width, height)
+            self._frame_cache = {
+                cached_key: cached
+                for cached_key, cached in self._frame_cache.items()
+                if cached_key[:2] == key[:2] and cached_key[2] is None
+            }
+            self._frame_cache[key] = frame
+        cr.set_source_surface(frame, 0, 0)
+        cr.paint()
+
+    def _draw_frame(self, cr, width, height):
+        # Store image rect for button positioning (the image itself is
+        # appended as a texture node in do_snapshot)
+        self.img_rect = self._image_rect(width, height)
+        self._frame_size = (width, height)
+        if not self.mouse_image:
+            # Draw placeholder
             cr.set_source_rgba(0.3, 0.3, 0.4, 1)
             cr.rectangle(*self.img_rect)
             cr.fill()
@@ -230,9 +329,19 @@ class MouseVisualization(Gtk.DrawingArea):
             cr.move_to(width * 0.35, height * 0.5)
             cr.show_text(_("MX Master 4"))
 
-        # Draw button labels (positioned relative to image rect)
+        # Draw button labels (positioned relative to image rect). The label
+        # font is selected once per frame; only the hovered label switches
+        # to bold, inside its own save/restore
+        cr.select_font_face("Sans", 0, 0)
+        cr.set_font_size(11)
         for btn_id, btn_info in MOUSE_BUTTONS.items():
-            self._draw_button_label(cr, btn_id, btn_info)
+            if btn_id == self.hovered_button:
+                cr.save()
+                cr.select_font_face("Sans", 0, 1)
+                self._draw_button_label(cr, btn_id, btn_info)
+                cr.restore()
+            else:
+                self._draw_button_label(cr, btn_id, btn_info)
 
     def _draw_button_label(self, cr, btn_id, btn_info):
         # Position buttons relative to the actual mouse image rect
@@ -243,15 +352,10 @@ class MouseVisualization(Gtk.DrawingArea):
         is_hovered = (btn_id == self.hovered_button)
         line_from = btn_info.get('line_from', 'left')
 
-        # Measure text
-        cr.select_font_face("Sans", 0, 1 if is_hovered else 0)
-        cr.set_font_size(11)
-        extents = cr.text_extents(label)
-
-        padding_x = 14
-        padding_y = 8
-        box_width = extents.width + padding_x * 2
-        box_height = extents.height + padding_y * 2
+        # Measure text (once per label and weight, in the font set by the caller)
+        extents, box_width, box_height, box_path = self._label_box(
+            cr, label, is_hovered
+        )
 
         # Calculate label position based on line direction
         custom_label_y = btn_info.get('label_y', None)
@@ -290,16 +394,21 @@ class MouseVisualization(Gtk.DrawingArea):
             line_start_x, line_start_y = x - 6, y
             line_end_x, line_end_y = label_x + box_width, y
 
+        # Skip buttons whose dot, line and label all fall off the canvas
+        # (small windows, or a pos outside the image)
+        frame_w, frame_h = self._frame_size
+        shadow_offset = 4
+        if (max(label_x + box_width + shadow_offset, x + 8) < 0
+                or min(label_x, x - 8) > frame_w
+                or max(label_y + box_height + shadow_offset, y + 8) < 0
+                or min(label_y, y - 8) > frame_h):
+            return
+
         # Draw shadow first (offset) - deeper shadow for premium feel
         cr.set_source_rgba(0, 0, 0, 0.4)
-        radius = 10
-        shadow_offset = 4
-        cr.new_path()
-        cr.arc(label_x + radius + shadow_offset, label_y + radius + shadow_offset, radius, math.pi, 1.5 * math.pi)
-        cr.arc(label_x + box_width - radius + shadow_offset, label_y + radius + shadow_offset, radius, 1.5 * math.pi, 2 * math.pi)
-        cr.arc(label_x + box_width - radius + shadow_offset, label_y + box_height - radius + shadow_offset, radius, 0, 0.5 * math.pi)
-        cr.arc(label_x + radius + shadow_offset, label_y + box_height - radius + shadow_offset, radius, 0.5 * math.pi, math.pi)
-        cr.close_path()
+        self._append_path_at(
+            cr, box_path, label_x + shadow_offset, label_y + shadow_offset
+        )
         cr.fill()
 
         # Premium glassmorphism background - dark with cyan glow
@@ -310,12 +419,7 @@ class MouseVisualization(Gtk.DrawingArea):
             # Normal: dark glass with subtle cyan tint
             cr.set_source_rgba(0.1, 0.11, 0.14, 0.92)  # Dark glass matching theme
 
-        cr.new_path()
-        cr.arc(label_x + radius, label_y + radius, radius, math.pi, 1.5 * math.pi)
-        cr.arc(label_x + box_width - radius, label_y + radius, radius, 1.5 * math.pi, 2 * math.pi)
-        cr.arc(label_x + box_width - radius, label_y + box_height - radius, radius, 0, 0.5 * math.pi)
-        cr.arc(label_x + radius, label_y + box_height - radius, radius, 0.5 * math.pi, math.pi)
-        cr.close_path()
+        self._append_path_at(cr, box_path, label_x, label_y)
         cr.fill()
 
         # Glass border - cyan accent glow
@@ -324,12 +428,7 @@ class MouseVisualization(Gtk.DrawingArea):
         else:
             cr.set_source_rgba(0, 0.83, 1, 0.35)  # Cyan border glow
         cr.set_line_width(1.5)
-        cr.new_path()
-        cr.arc(label_x + radius, label_y + radius, radius, math.pi, 1.5 * math.pi)
-        cr.arc(label_x + box_width - radius, label_y + radius, radius, 1.5 * math.pi, 2 * math.pi)
-        cr.arc(label_x + box_width - radius, label_y + box_height - radius, radius, 0, 0.5 * math.pi)
-        cr.arc(label_x + radius, label_y + box_height - radius, radius, 0.5 * math.pi, math.pi)
-        cr.close_path()
+        self._append_path_at(cr, box_path, label_x, label_y)
         cr.stroke()
 
         # Draw text
@@ -337,7 +436,10 @@ class MouseVisualization(Gtk.DrawingArea):
             cr.set_source_rgba(0.04, 0.05, 0.06, 1)  # Dark text on cyan bg
         else:
             cr.set_source_rgba(0.94, 0.96, 0.97, 1)  # Bright white text
-        cr.move_to(label_x + padding_x, label_y + padding_y + extents.height)
+        cr.move_to(
+            label_x + self.LABEL_PADDING_X,
+            label_y + self.LABEL_PADDING_Y + extents.height,
+        )
         cr.show_text(label)
 
         # Draw connector line - cyan accent
@@ -361,34 +463,45 @@ class MouseVisualization(Gtk.DrawingArea):
         if is_hovered:
             # Glowing dot on hover
             cr.set_source_rgba(0, 0.83, 1, 0.4)  # Outer glow
-            cr.arc(x, y, 8, 0, 2 * math.pi)
+            cr.arc(x, y, 8, 0, _TWO_PI)
             cr.fill()
             cr.set_source_rgba(0, 0.83, 1, 1)  # Bright cyan dot
         else:
             cr.set_source_rgba(0, 0.83, 1, 0.8)  # Cyan dot
-        cr.arc(x, y, 5, 0, 2 * math.pi)
-        cr.fill()
+        cr.arc(x, y, 5, 0, _TWO_PI)
+        cr.fill_preserve()
 
-        # Dot border - white highlight
+        # Dot border - white highlight (same circle, path kept by fill_preserve)
         cr.set_source_rgba(1, 1, 1, 0.6)
         cr.set_line_width(1.5)
-        cr.arc(x, y, 5, 0, 2 * math.pi)
         cr.stroke()
 
-    def _texture_to_pixbuf(self, texture):
-        """Convert Gdk.Texture to GdkPixbuf for cairo rendering"""
-        try:
-            from gi.repository import GdkPixbuf
-
-            # Get texture data as PNG bytes and convert to pixbuf
-            data = texture.save_to_png_bytes()
-            loader = GdkPixbuf.PixbufLoader.new_with_type('png')
-            loader.write(data.get_data())
-            loader.close()
-            return loader.get_pixbuf()
-        except Exception as e:
-            print(f"Texture conversion error: {e}")
-            return None
+    def _label_box(self, cr, label, is_hovered):
+        """Text extents, box size and rounded box path (at the origin) for a label
+
+        Measured with the font currently selected on cr, then cached so
+        redraws skip text shaping and path construction.
+        """
+        key = (label, is_hovered)
+        entry = self._label_cache.get(key)
+        if entry is None:
+            extents = cr.text_extents(label)
+            box_width = extents.width + self.LABEL_PADDING_X * 2
+            box_height = extents.height + self.LABEL_PADDING_Y * 2
+            box_path = _rounded_rect_path(box_width, box_height, 10)
+
+            entry = (extents, box_width, box_height, box_path)
+            self._label_cache[key] = entry
+        return entry
+
+    @staticmethod
+    def _append_path_at(cr, path, x, y):
+        """Replace the current path with a cached path translated to (x, y)"""
+        cr.save()
+        cr.translate(x, y)
+        cr.new_path()
+        cr.append_path(path)
+        cr.restore()  # The path survives restore - cairo keeps it in device space
 
 
 class SettingsCard(Gtk.Box):
@@ -419,12 +532,16 @@ class SettingRow(Gtk.Box):
         label_widget.set_halign(Gtk.Align.START)
         label_widget.add_css_class('setting-label')
         text_box.append(label_widget)
+        # Kept so callers can update text without walking the widget tree
+        self.label_widget = label_widget
+        self.desc_widget = None
 
         if description:
             desc_widget = Gtk.Label(label=description)
             desc_widget.set_halign(Gtk.Align.START)
             desc_widget.add_css_class('setting-value')
             text_box.append(desc_widget)
+            self.desc_widget = desc_widget
 
         self.append(text_box)
 
@@ -8,10 +8,20 @@ Themes affect both components when changed in settings.
 SPDX-License-Identifier: GPL-3.0
 """
 
-import json
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
+# Use orjson for config parsing if available (parses bytes directly)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # THEME DEFINITIONS
 # Each theme defines colors that work for both dark and light UIs
@@ -478,26 +488,53 @@ THEMES = {
 # Default theme
 DEFAULT_THEME = "juhradial-mx"
 
+# Valid theme names - validation doesn't need the THEMES definitions
+THEME_NAMES = frozenset(THEMES)
+
+# Same location the daemon uses (dirs::config_dir honors $XDG_CONFIG_HOME)
+CONFIG_DIR = (
+    Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "juhradial"
+)
+CONFIG_FILE = CONFIG_DIR / "config.json"
+
+# Well-known session bus name owned by the running overlay
+OVERLAY_BUS_NAME = "org.kde.juhradialmx.Overlay"
+
+
+@lru_cache(maxsize=4)
+def _read_config(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse config file - memoized on (path, mtime) so unchanged files aren't re-read"""
+    return _json_loads(Path(path_str).read_bytes())
+
+
+def load_config() -> Dict[str, Any]:
+    """Return parsed config.json (empty dict if missing).
+
+    Costs one stat() while the file is unchanged. The dict is shared
+    between callers and must not be modified.
+    """
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _read_config(str(CONFIG_FILE), mtime_ns)
+
 
 def load_theme_name() -> str:
     """Load theme name from config file"""
-    config_path = Path.home() / ".config" / "juhradial" / "config.json"
     theme_name = DEFAULT_THEME
 
     try:
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                theme_name = config.get("theme", DEFAULT_THEME)
+        theme_name = load_config().get("theme", DEFAULT_THEME)
     except Exception as e:
-        print(f"Could not load theme from config: {e}")
+        logger.warning("Could not load theme from config: %s", e)
 
     # Handle 'system' theme - default to juhradial-mx
     if theme_name == "system":
         theme_name = DEFAULT_THEME
 
-    if theme_name not in THEMES:
-        print(f"Unknown theme '{theme_name}', using {DEFAULT_THEME}")
+    if theme_name not in THEME_NAMES:
+        logger.warning("Unknown theme '%s', using %s", theme_name, DEFAULT_THEME)
         theme_name = DEFAULT_THEME
 
     return theme_name
@@ -533,6 +570,17 @@ def get_radial_params(theme_name: Optional[str] = None) -> Optional[Dict[str, An
     return theme.get("radial_params", None)
 
 
+@lru_cache(maxsize=256)
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Parse '#rrggbb' into an (r, g, b) tuple of ints (memoized)"""
+    hex_color = hex_color.lstrip("#")
+    return (
+        int(hex_color[0:2], 16),
+        int(hex_color[2:4], 16),
+        int(hex_color[4:6], 16),
+    )
+
+
 def is_dark_theme(theme_name: Optional[str] = None) -> bool:
     """Check if theme is dark or light"""
     theme = get_theme(theme_name)
@@ -19,6 +19,7 @@ BuildRequires:  gtk4-layer-shell-devel
 BuildRequires:  dbus-devel
 BuildRequires:  systemd-devel
 BuildRequires:  libevdev-devel
+BuildRequires:  python3-devel
 
 Requires:       logiops
 Requires:       gtk4
@@ -70,6 +71,7 @@ install -Dm755 juhradial-mx.sh %{buildroot}%{_bindir}/juhradial-mx
 # Install overlay Python files
 install -dm755 %{buildroot}%{_datadir}/juhradial
 install -Dm644 overlay/*.py %{buildroot}%{_datadir}/juhradial/
+%py_byte_compile %{python3} %{buildroot}%{_datadir}/juhradial/
 
 # Install locales
 if [ -d overlay/locales ]; then
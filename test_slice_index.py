@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Check slice_index's octant tests against the original atan2 formula."""
+
+import math
+import unittest
+
+from overlay.radial_geometry import slice_index
+
+GRID = range(-300, 301)
+
+
+def atan2_slice_index(dx, dy):
+    """Slice lookup as the overlay computed it before the octant tests"""
+    angle = (math.degrees(math.atan2(dx, -dy)) + 360) % 360
+    return int((angle + 22.5) / 45) % 8
+
+
+class SliceIndexTest(unittest.TestCase):
+    def test_matches_atan2_over_grid(self):
+        mismatches = [
+            (dx, dy, slice_index(dx, dy), atan2_slice_index(dx, dy))
+            for dx in GRID
+            for dy in GRID
+            if (dx or dy) and slice_index(dx, dy) != atan2_slice_index(dx, dy)
+        ]
+        self.assertEqual(mismatches, [])
+
+    def test_axes(self):
+        self.assertEqual(slice_index(0, -1), 0)
+        self.assertEqual(slice_index(1, 0), 2)
+        self.assertEqual(slice_index(0, 1), 4)
+        self.assertEqual(slice_index(-1, 0), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()